@@ -2,12 +2,13 @@
 
 from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 import tempfile
 import os
 import uuid
+from dataclasses import asdict
 from datetime import datetime
 
 from app.api import deps
@@ -38,6 +39,8 @@ class ImportRequest(BaseModel):
     skip_duplicates: bool = True
     update_existing: bool = False
     dry_run: bool = False
+    # YAML only: import after the top-level checks and run per-record validation in the background
+    defer_validation: bool = False
     field_mappings: Optional[List[Dict[str, Any]]] = None
 
 
@@ -153,7 +156,7 @@ async def export_data(
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
 
 
-@router.post("/import/preview", response_model=ImportPreviewResponse)
+@router.post("/import/preview", response_model=ImportPreviewResponse, response_class=ORJSONResponse)
 async def preview_import(
     file: UploadFile = File(...),
     db: Session = Depends(deps.get_db),
@@ -199,6 +202,7 @@ async def preview_import(
 
 @router.post("/import", response_model=ImportResponse)
 async def import_data(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     import_config: str = Form(...),  # JSON string of ImportRequest
     db: Session = Depends(deps.get_db),
@@ -229,7 +233,9 @@ async def import_data(
             validate_before_import=import_request.validate_before_import,
             skip_duplicates=import_request.skip_duplicates,
             update_existing=import_request.update_existing,
-            dry_run=import_request.dry_run
+            dry_run=import_request.dry_run,
+            # A dry run never schedules the deferred validation, so it checks records up front
+            skip_structural_validation=import_request.defer_validation and not import_request.dry_run
         )
         
         # Convert field mappings
@@ -250,8 +256,27 @@ async def import_data(
         # Perform import
         result = importer.import_from_file(temp_file.name, field_mappings)
         
-        # Clean up temporary file
-        os.unlink(temp_file.name)
+        if (import_request.defer_validation and isinstance(importer, YAMLImporter)
+                and result.success and not import_request.dry_run):
+            # The background task validates the committed file and removes it
+            validation_id = str(uuid.uuid4())
+            task_results[validation_id] = {
+                "status": "processing",
+                "started_at": datetime.now()
+            }
+            background_tasks.add_task(
+                run_deferred_validation,
+                validation_id,
+                temp_file.name
+            )
+            result.validation_results = {
+                "deferred": True,
+                "validation_id": validation_id,
+                "check_status_url": f"/api/v1/import-export/validation-status/{validation_id}"
+            }
+        else:
+            # Clean up temporary file
+            os.unlink(temp_file.name)
         
         return ImportResponse(
             success=result.success,
@@ -271,6 +296,40 @@ async def import_data(
         raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
 
 
+@router.get("/validation-status/{validation_id}")
+async def get_validation_status(validation_id: str):
+    """Get status of a deferred import validation."""
+    if validation_id not in task_results:
+        raise HTTPException(status_code=404, detail="Validation run not found")
+    
+    return task_results[validation_id]
+
+
+def run_deferred_validation(validation_id: str, file_path: str):
+    """Run the full YAML validation skipped by a deferred import.
+    
+    Runs after the response is sent, when the request's session has been
+    closed; validation only reads the file, so the importer gets no session.
+    """
+    try:
+        is_valid, errors, warnings = YAMLImporter(db=None).validate_file(file_path)
+        
+        task_results[validation_id].update({
+            "status": "completed",
+            "valid": is_valid,
+            "errors": errors,
+            "warnings": warnings,
+            "completed_at": datetime.now()
+        })
+        
+    except Exception as e:
+        task_results[validation_id]["status"] = "failed"
+        task_results[validation_id]["error"] = str(e)
+        task_results[validation_id]["completed_at"] = datetime.now()
+    finally:
+        os.unlink(file_path)
+
+
 @router.get("/download/{filename}")
 async def download_export_file(
     filename: str,
@@ -321,7 +380,7 @@ async def validate_data(
         
         return {
             "valid": is_valid,
-            "results": [result.dict() for result in results]
+            "results": [asdict(result) for result in results]
         }
         
     except Exception as e:
@@ -1,7 +1,7 @@
 """Import/Export services for YAML, JSON, and Excel formats."""
 
-from .base_exporter import BaseExporter
-from .base_importer import BaseImporter
+from .base_exporter import BaseExporter, ExportConfig
+from .base_importer import BaseImporter, ImportConfig, FieldMapping
 from .yaml_exporter import YAMLExporter
 from .json_exporter import JSONExporter
 from .excel_exporter import ExcelExporter
@@ -13,6 +13,9 @@ from .validation import ImportValidator, ExportValidator
 __all__ = [
     "BaseExporter",
     "BaseImporter", 
+    "ExportConfig",
+    "ImportConfig",
+    "FieldMapping",
     "YAMLExporter",
     "JSONExporter",
     "ExcelExporter",
@@ -1,7 +1,7 @@
 """Base export functionality for ARS data."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 from datetime import datetime
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
@@ -18,7 +18,7 @@ class ExportConfig(BaseModel):
     include_timestamps: bool = True
     flatten_nested: bool = False
     batch_size: int = 1000
-    progress_callback: Optional[callable] = None
+    progress_callback: Optional[Callable] = None
 
 
 class ExportResult(BaseModel):
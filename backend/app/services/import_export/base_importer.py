@@ -1,8 +1,11 @@
 """Base import functionality for ARS data."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 from datetime import datetime
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
@@ -12,6 +15,27 @@ from app.models.ars import (
 )
 
 
+@lru_cache(maxsize=None)
+def mapped_attribute_names(model_class: Any) -> FrozenSet[str]:
+    """Names of the mapped attributes of a model class, computed once per class."""
+    return frozenset(attr.key for attr in sa_inspect(model_class).attrs)
+
+
+# Named value transforms available to field mappings
+_TRANSFORMS: Dict[str, Callable[[Any], Any]] = {
+    "upper": lambda x: str(x).upper(),
+    "lower": lambda x: str(x).lower(),
+    "strip": lambda x: str(x).strip(),
+    "to_int": lambda x: int(x) if x else None,
+    "to_float": lambda x: float(x) if x else None,
+    "to_bool": lambda x: str(x).lower() in ['true', '1', 'yes', 'on'] if x else False,
+    "to_datetime": lambda x: datetime.fromisoformat(str(x)) if x else None
+}
+
+# (source_field, target_field, required, default_value, transform)
+CompiledFieldMapping = Tuple[str, str, bool, Any, Optional[Callable[[Any], Any]]]
+
+
 class ImportConfig(BaseModel):
     """Configuration for import operations."""
     validate_before_import: bool = True
@@ -19,7 +43,11 @@ class ImportConfig(BaseModel):
     skip_duplicates: bool = True
     update_existing: bool = False
     dry_run: bool = False
-    progress_callback: Optional[callable] = None
+    use_bulk: bool = False  # bulk_insert_mappings skips model __init__ and ORM events
+    # Skip per-record checks (YAML); the caller must validate the records after import,
+    # as the import endpoint does with its deferred re-validation
+    skip_structural_validation: bool = False
+    progress_callback: Optional[Callable] = None
 
 
 class FieldMapping(BaseModel):
@@ -31,15 +59,16 @@ class FieldMapping(BaseModel):
     transform_function: Optional[str] = None
 
 
-class ImportResult(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ImportResult:
     """Result of an import operation."""
     success: bool
     message: str
     records_imported: int = 0
     records_updated: int = 0
     records_skipped: int = 0
-    errors: List[str] = []
-    warnings: List[str] = []
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
     import_time: datetime
     validation_results: Optional[Dict[str, Any]] = None
 
@@ -67,42 +96,60 @@ class BaseImporter(ABC):
         pass
         
     def _apply_field_mapping(self, data: Dict[str, Any], field_mappings: List[FieldMapping]) -> Dict[str, Any]:
-        """Apply field mappings to transform import data."""
+        """Apply field mappings to transform import data.
+        
+        Returns a new dict (or the input unchanged when there are no mappings);
+        the input dict is never modified.
+        """
         if not field_mappings:
             return data
+        
+        return self._apply_compiled_field_mapping(data, self._compile_field_mapping(field_mappings))
+        
+    def _compile_field_mapping(self, field_mappings: List[FieldMapping]) -> List[CompiledFieldMapping]:
+        """Flatten field mappings into tuples with resolved transform functions.
+        
+        Compile once per import and use _apply_compiled_field_mapping per record.
+        """
+        return [
+            (
+                mapping.source_field,
+                mapping.target_field,
+                mapping.required,
+                mapping.default_value,
+                _TRANSFORMS.get(mapping.transform_function) if mapping.transform_function else None
+            )
+            for mapping in field_mappings
+        ]
+        
+    def _apply_compiled_field_mapping(self, data: Dict[str, Any],
+                                      compiled_mappings: List[CompiledFieldMapping]) -> Dict[str, Any]:
+        """Apply field mappings prepared by _compile_field_mapping."""
+        if not compiled_mappings:
+            return data
             
         mapped_data = {}
         
-        for mapping in field_mappings:
-            source_value = data.get(mapping.source_field)
+        for source_field, target_field, required, default_value, transform in compiled_mappings:
+            source_value = data.get(source_field)
             
             if source_value is None:
-                if mapping.required:
-                    raise ValueError(f"Required field {mapping.source_field} is missing")
-                source_value = mapping.default_value
+                if required:
+                    raise ValueError(f"Required field {source_field} is missing")
+                source_value = default_value
             
             # Apply transformation if specified
-            if mapping.transform_function and source_value is not None:
-                source_value = self._apply_transform(source_value, mapping.transform_function)
+            if transform is not None and source_value is not None:
+                source_value = transform(source_value)
             
-            mapped_data[mapping.target_field] = source_value
+            mapped_data[target_field] = source_value
             
         return mapped_data
         
     def _apply_transform(self, value: Any, transform_function: str) -> Any:
         """Apply transformation function to a value."""
-        transforms = {
-            "upper": lambda x: str(x).upper(),
-            "lower": lambda x: str(x).lower(),
-            "strip": lambda x: str(x).strip(),
-            "to_int": lambda x: int(x) if x else None,
-            "to_float": lambda x: float(x) if x else None,
-            "to_bool": lambda x: str(x).lower() in ['true', '1', 'yes', 'on'] if x else False,
-            "to_datetime": lambda x: datetime.fromisoformat(str(x)) if x else None
-        }
-        
-        if transform_function in transforms:
-            return transforms[transform_function](value)
+        if transform_function in _TRANSFORMS:
+            return _TRANSFORMS[transform_function](value)
         
         return value
         
@@ -116,15 +163,22 @@ class BaseImporter(ABC):
         """Check if a record with the given identifier already exists."""
         return self.db.query(model_class).filter(model_class.id == identifier).first() is not None
         
+    def _fetch_existing_ids(self, model_class: Any, identifiers: Set[Any]) -> Set[Any]:
+        """Return the subset of identifiers that already exist, using a single query."""
+        identifiers = {identifier for identifier in identifiers if identifier is not None}
+        if not identifiers:
+            return set()
+        return {
+            row.id for row in self.db.query(model_class.id).filter(model_class.id.in_(identifiers)).all()
+        }
+        
     def _create_or_update_record(self, model_class: Any, data: Dict[str, Any], identifier: str) -> Tuple[Any, bool]:
         """Create a new record or update existing one."""
         existing = self.db.query(model_class).filter(model_class.id == identifier).first()
         
         if existing:
             if self.config.update_existing:
-                for key, value in data.items():
-                    if hasattr(existing, key):
-                        setattr(existing, key, value)
+                self._apply_updates(existing, data)
                 return existing, True  # Updated
             else:
                 return existing, False  # Skipped
@@ -133,6 +187,11 @@ class BaseImporter(ABC):
             self.db.add(new_record)
             return new_record, True  # Created
             
+    def _apply_updates(self, record: Any, data: Dict[str, Any]):
+        """Copy values onto an existing record for keys that are mapped attributes."""
+        for key in data.keys() & mapped_attribute_names(type(record)):
+            setattr(record, key, data[key])
+            
     def _validate_required_fields(self, data: Dict[str, Any], required_fields: List[str]) -> List[str]:
         """Validate that required fields are present."""
         errors = []
@@ -12,6 +12,21 @@ from .base_importer import BaseImporter, ImportResult, FieldMapping
 class ExcelImporter(BaseImporter):
     """Excel format importer for ARS data."""
     
+    # Required columns per sheet type
+    _REQUIRED_COLS = {
+        sheet_name: frozenset(columns) for sheet_name, columns in {
+            "ReportingEvent": ["id", "name"],
+            "Analyses": ["id", "name"],
+            "Methods": ["id", "name"],
+            "AnalysisSets": ["id", "name"],
+            "DataSubsets": ["id", "name"],
+            "Groups": ["id", "name"],
+            "Operations": ["id", "name"],
+            "Outputs": ["id", "name"],
+            "WhereClauses": ["id"]
+        }.items()
+    }
+    
     def import_from_file(self, file_path: str, field_mapping: Optional[List[FieldMapping]] = None) -> ImportResult:
         """Import data from an Excel file."""
         try:
@@ -192,7 +207,7 @@ class ExcelImporter(BaseImporter):
                 df = data["ReportingEvent"]
                 if not df.empty:
                     # Assume first row contains the reporting event data
-                    re_data = df.iloc[0].to_dict()
+                    re_data = dict(zip(df.columns, next(df.itertuples(index=False, name=None))))
                     re_data = self._clean_excel_data(re_data)
                     
                     if field_mapping:
@@ -208,9 +223,7 @@ class ExcelImporter(BaseImporter):
                         existing = self.db.query(ReportingEvent).filter(
                             ReportingEvent.id == re_data.get("id")
                         ).first()
-                        for key, value in re_data.items():
-                            if hasattr(existing, key):
-                                setattr(existing, key, value)
+                        self._apply_updates(existing, re_data)
                         updated += 1
                     else:
                         skipped += 1
@@ -220,7 +233,8 @@ class ExcelImporter(BaseImporter):
                 df = data["Analyses"]
                 if not df.empty:
                     total_analyses = len(df)
-                    for i, row in df.iterrows():
+                    progress_step = max(1, total_analyses // 100)
+                    for i, (_, row) in enumerate(df.iterrows()):
                         try:
                             analysis_data = row.to_dict()
                             analysis_data = self._clean_excel_data(analysis_data)
@@ -242,9 +256,10 @@ class ExcelImporter(BaseImporter):
                             else:
                                 skipped += 1
                                 
-                            # Update progress
-                            progress = 40 + ((i + 1) / total_analyses) * 50
-                            self._update_progress(progress, 100, f"Imported analysis {i + 1}/{total_analyses}")
+                            # Update progress (throttled to roughly 100 updates per sheet)
+                            if (i + 1) % progress_step == 0 or i + 1 == total_analyses:
+                                progress = 40 + ((i + 1) / total_analyses) * 50
+                                self._update_progress(progress, 100, f"Imported analysis {i + 1}/{total_analyses}")
                             
                         except Exception as e:
                             errors.append(f"Failed to import analysis row {i + 1}: {str(e)}")
@@ -296,6 +311,11 @@ class ExcelImporter(BaseImporter):
     def _import_sheet(self, df: pd.DataFrame, model_name: str, 
                      field_mapping: Optional[List[FieldMapping]] = None) -> Tuple[int, int, int, List[str]]:
         """Import a specific Excel sheet."""
+        # Rows are not persisted yet, so without a field mapping (the only
+        # thing that can fail per row) every row simply counts as imported.
+        if not field_mapping:
+            return len(df.index), 0, 0, []
+        
         imported = 0
         updated = 0
         skipped = 0
@@ -303,11 +323,8 @@ class ExcelImporter(BaseImporter):
         
         for i, row in df.iterrows():
             try:
-                item_data = row.to_dict()
-                item_data = self._clean_excel_data(item_data)
-                
-                if field_mapping:
-                    item_data = self._apply_field_mapping(item_data, field_mapping)
+                item_data = self._clean_excel_data(row.to_dict())
+                item_data = self._apply_field_mapping(item_data, field_mapping)
                 
                 # This is a simplified version - in reality you'd use the actual model class
                 imported += 1
@@ -341,22 +358,9 @@ class ExcelImporter(BaseImporter):
             return errors  # Empty sheets are handled as warnings
         
         # Check for required columns based on sheet type
-        required_columns = {
-            "ReportingEvent": ["id", "name"],
-            "Analyses": ["id", "name"],
-            "Methods": ["id", "name"],
-            "AnalysisSets": ["id", "name"],
-            "DataSubsets": ["id", "name"],
-            "Groups": ["id", "name"],
-            "Operations": ["id", "name"],
-            "Outputs": ["id", "name"],
-            "WhereClauses": ["id"]
-        }
-        
-        if sheet_name in required_columns:
-            for col in required_columns[sheet_name]:
-                if col not in df.columns:
-                    errors.append(f"Sheet '{sheet_name}' missing required column '{col}'")
+        missing = self._REQUIRED_COLS.get(sheet_name, frozenset()) - set(df.columns)
+        for col in sorted(missing):
+            errors.append(f"Sheet '{sheet_name}' missing required column '{col}'")
         
         # Check for duplicate IDs within sheet
         if "id" in df.columns:
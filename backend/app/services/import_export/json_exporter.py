@@ -37,14 +37,7 @@ class JSONExporter(BaseExporter):
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             
             # Write JSON file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(
-                    data, 
-                    f, 
-                    indent=2,
-                    ensure_ascii=False,
-                    default=self._json_serializer
-                )
+            self._write_json(data, output_path)
             
             self._update_progress(100, 100, "Export completed")
             
@@ -100,8 +93,7 @@ class JSONExporter(BaseExporter):
             
             # Write JSON file
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=self._json_serializer)
+            self._write_json(data, output_path)
             
             self._update_progress(100, 100, "Export completed")
             
@@ -140,8 +132,7 @@ class JSONExporter(BaseExporter):
             
             # Write JSON file
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=self._json_serializer)
+            self._write_json(data, output_path)
             
             self._update_progress(100, 100, "Custom query export completed")
             
@@ -162,6 +153,20 @@ class JSONExporter(BaseExporter):
                 export_time=datetime.now()
             )
     
+    def _write_json(self, data: Dict[str, Any], output_path: str):
+        """Write JSON to a temporary file and atomically move it into place."""
+        tmp_path = output_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False, default=self._json_serializer)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
     def _json_serializer(self, obj):
         """Custom JSON serializer for datetime and other objects."""
         if isinstance(obj, datetime):
@@ -5,8 +5,70 @@ from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 import os
 
+from app.models.ars import (
+    ReportingEvent, Analysis, AnalysisMethod, AnalysisSet,
+    DataSubset, Group, Operation, Output, WhereClause
+)
+
 from .base_importer import BaseImporter, ImportResult, FieldMapping
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:  # ciso8601 is optional; fromisoformat needs 'Z' spelled out
+    def _parse_iso_datetime(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# Fields converted from ISO strings back to datetime objects on import
+DT_FIELDS = frozenset(("created_at", "updated_at", "date", "timestamp"))
+
+# Required fields for reporting events and analyses
+REQUIRED_FIELDS = ("id", "name")
+
+# Sentinel for telling absent keys apart from explicit nulls
+_MISSING = object()
+
+def _validate_analysis_record(analysis_data: Any, context: str) -> List[str]:
+    """Validate one analysis record."""
+    errors = []
+    
+    if not isinstance(analysis_data, dict):
+        errors.append(f"{context}: Analysis must be an object")
+        return errors
+    
+    for field in REQUIRED_FIELDS:
+        # A missing key and an explicit null are both reported as missing
+        if analysis_data.get(field) is None:
+            errors.append(f"{context}: Missing required field '{field}'")
+    
+    # JSON-specific validations
+    analysis_id = analysis_data.get("id", _MISSING)
+    if analysis_id is not _MISSING and not isinstance(analysis_id, str):
+        errors.append(f"{context}: Analysis ID must be a string")
+    
+    return errors
+
+
+def _describe_list(value: list, limit: int) -> Tuple[str, Optional[list]]:
+    """Describe a top-level array for preview; sample is None when omitted."""
+    return f"Array with {len(value)} items", (value[:limit] if value and limit > 0 else None)
+
+
+def _describe_dict(value: dict, limit: int) -> Tuple[str, dict]:
+    """Describe a top-level object for preview."""
+    return f"Object with {len(value)} properties", value
+
+
+# Preview describers keyed by exact JSON container type
+_STRUCTURE_DESCRIBERS = {
+    list: _describe_list,
+    dict: _describe_dict
+}
+
 
 class JSONImporter(BaseImporter):
     """JSON format importer for ARS data."""
@@ -25,8 +87,7 @@ class JSONImporter(BaseImporter):
                 )
             
             # Load JSON data
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._load_json(file_path)
             
             self._update_progress(20, 100, "JSON data loaded, validating...")
             
@@ -105,33 +166,36 @@ class JSONImporter(BaseImporter):
         
         # Validate reporting event if present
         if "reportingEvent" in data:
-            re_errors = self._validate_reporting_event(data["reportingEvent"])
+            re_data = data["reportingEvent"]
+            re_errors = self._validate_reporting_event(re_data)
             errors.extend(re_errors)
+            if re_data and isinstance(re_data, dict) and re_data.get("id") is None:
+                errors.append("Reporting event ID cannot be null")
         
         # Validate analyses if present
         if "analyses" in data:
             if not isinstance(data["analyses"], list):
                 errors.append("'analyses' must be an array")
             else:
-                for i, analysis in enumerate(data["analyses"]):
-                    analysis_errors = self._validate_analysis(analysis, f"analyses[{i}]")
-                    errors.extend(analysis_errors)
+                errors.extend(
+                    error
+                    for i, analysis in enumerate(data["analyses"])
+                    for error in _validate_analysis_record(analysis, f"analyses[{i}]")
+                )
         
         # Check for optional sections
         optional_sections = ["methods", "analysisSets", "dataSubsets", "groups", "operations", "outputs", "whereClauses"]
         for section in optional_sections:
-            if section in data:
+            # Optional sections may be null
+            if data.get(section) is not None:
                 if not isinstance(data[section], list):
-                    errors.append(f"'{section}' must be an array")
+                    errors.append(f"'{section}' must be an array or null")
                 else:
                     # Validate each item in the section
                     for i, item in enumerate(data[section]):
                         if not isinstance(item, dict):
                             errors.append(f"'{section}[{i}]' must be an object")
         
-        # Validate JSON-specific data types
-        self._validate_json_types(data, errors)
-        
         is_valid = len(errors) == 0
         
         return is_valid, errors, warnings
@@ -139,8 +203,7 @@ class JSONImporter(BaseImporter):
     def preview_import(self, file_path: str, limit: int = 10) -> Dict[str, Any]:
         """Preview JSON import data before actual import."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._load_json(file_path)
             
             preview = {
                 "file_type": "JSON",
@@ -159,16 +222,15 @@ class JSONImporter(BaseImporter):
                 if key == "metadata":
                     continue
                     
-                if isinstance(value, list):
-                    preview["structure"][key] = f"Array with {len(value)} items"
-                    if value and limit > 0:
-                        preview["sample_data"][key] = value[:limit]
-                elif isinstance(value, dict):
-                    preview["structure"][key] = f"Object with {len(value)} properties"
-                    preview["sample_data"][key] = value
-                else:
+                describe = _STRUCTURE_DESCRIBERS.get(type(value))
+                if describe is None:
                     preview["structure"][key] = type(value).__name__
                     preview["sample_data"][key] = value
+                    continue
+                
+                preview["structure"][key], sample = describe(value, limit)
+                if sample is not None:
+                    preview["sample_data"][key] = sample
             
             # Run validation
             is_valid, errors, warnings = self.validate_import_data(data)
@@ -191,6 +253,16 @@ class JSONImporter(BaseImporter):
                 "file_type": "JSON"
             }
     
+    def _load_json(self, file_path: str) -> Any:
+        """Parse a JSON file, preferring orjson over the stdlib parser."""
+        if orjson is not None:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
     def _import_json_data(self, data: Dict[str, Any], field_mapping: Optional[List[FieldMapping]] = None) -> ImportResult:
         """Import the actual JSON data."""
         imported = 0
@@ -205,8 +277,6 @@ class JSONImporter(BaseImporter):
                 if field_mapping:
                     re_data = self._apply_field_mapping(re_data, field_mapping)
                 
-                from app.models.ars import ReportingEvent
-                
                 if not self._check_duplicate(ReportingEvent, re_data.get("id")):
                     # Convert datetime strings back to datetime objects
                     re_data = self._convert_datetime_fields(re_data)
@@ -218,9 +288,7 @@ class JSONImporter(BaseImporter):
                         ReportingEvent.id == re_data.get("id")
                     ).first()
                     re_data = self._convert_datetime_fields(re_data)
-                    for key, value in re_data.items():
-                        if hasattr(existing, key):
-                            setattr(existing, key, value)
+                    self._apply_updates(existing, re_data)
                     updated += 1
                 else:
                     skipped += 1
@@ -228,50 +296,83 @@ class JSONImporter(BaseImporter):
             # Import analyses if present
             if "analyses" in data:
                 total_analyses = len(data["analyses"])
+                progress_step = max(1, total_analyses // 100)
+                # Map records up front so the incoming IDs are known before the lookup
+                mapped_analyses = []
                 for i, analysis_data in enumerate(data["analyses"]):
                     try:
                         if field_mapping:
                             analysis_data = self._apply_field_mapping(analysis_data, field_mapping)
-                        
+                        mapped_analyses.append((i, analysis_data))
+                    except Exception as e:
+                        errors.append(f"Failed to import analysis {i}: {str(e)}")
+                
+                # Look up only the incoming IDs, once instead of querying per record
+                existing_ids = self._fetch_existing_ids(
+                    Analysis, {analysis_data.get("id") for _, analysis_data in mapped_analyses}
+                )
+                pending_updates = {}
+                new_records = []
+                for i, analysis_data in mapped_analyses:
+                    try:
                         # Convert datetime fields
                         analysis_data = self._convert_datetime_fields(analysis_data)
                         
-                        from app.models.ars import Analysis
-                        
-                        record, was_modified = self._create_or_update_record(
-                            Analysis, analysis_data, analysis_data.get("id")
-                        )
-                        
-                        if was_modified:
-                            if self._check_duplicate(Analysis, analysis_data.get("id")):
-                                updated += 1
+                        analysis_id = analysis_data.get("id")
+                        if analysis_id not in existing_ids:
+                            if self.config.use_bulk:
+                                new_records.append(analysis_data)
                             else:
-                                imported += 1
+                                self.db.add(Analysis(**analysis_data))
+                            existing_ids.add(analysis_id)
+                            imported += 1
+                        elif self.config.update_existing:
+                            pending_updates[analysis_id] = analysis_data
+                            updated += 1
                         else:
                             skipped += 1
                             
-                        # Update progress
-                        progress = 40 + ((i + 1) / total_analyses) * 50
-                        self._update_progress(progress, 100, f"Imported analysis {i + 1}/{total_analyses}")
+                        # Update progress (throttled to roughly 100 updates per import)
+                        if (i + 1) % progress_step == 0 or i + 1 == total_analyses:
+                            progress = 40 + ((i + 1) / total_analyses) * 50
+                            self._update_progress(progress, 100, f"Imported analysis {i + 1}/{total_analyses}")
                         
                     except Exception as e:
                         errors.append(f"Failed to import analysis {i}: {str(e)}")
+                    
+                    # Flush in batches so clean objects can leave the identity map
+                    if (i + 1) % self.config.batch_size == 0:
+                        if new_records:
+                            self.db.bulk_insert_mappings(Analysis, new_records)
+                            new_records.clear()
+                        self.db.flush()
+                
+                if new_records:
+                    self.db.bulk_insert_mappings(Analysis, new_records)
+                
+                # Apply updates with a single query for all existing records
+                if pending_updates:
+                    existing_records = self.db.query(Analysis).filter(
+                        Analysis.id.in_(pending_updates)
+                    ).all()
+                    for existing in existing_records:
+                        self._apply_updates(existing, pending_updates[existing.id])
             
             # Import other sections
             section_models = {
-                "methods": "AnalysisMethod",
-                "analysisSets": "AnalysisSet", 
-                "dataSubsets": "DataSubset",
-                "groups": "Group",
-                "operations": "Operation",
-                "outputs": "Output",
-                "whereClauses": "WhereClause"
+                "methods": AnalysisMethod,
+                "analysisSets": AnalysisSet,
+                "dataSubsets": DataSubset,
+                "groups": Group,
+                "operations": Operation,
+                "outputs": Output,
+                "whereClauses": WhereClause
             }
             
-            for section, model_name in section_models.items():
-                if section in data:
+            for section, model_class in section_models.items():
+                if data.get(section):
                     section_imported, section_updated, section_skipped, section_errors = self._import_section(
-                        data[section], model_name, field_mapping
+                        data[section], model_class, field_mapping
                     )
                     imported += section_imported
                     updated += section_updated
@@ -299,7 +400,7 @@ class JSONImporter(BaseImporter):
                 import_time=datetime.now()
             )
     
-    def _import_section(self, section_data: List[Dict[str, Any]], model_name: str, 
+    def _import_section(self, section_data: List[Dict[str, Any]], model_class: Any, 
                        field_mapping: Optional[List[FieldMapping]] = None) -> Tuple[int, int, int, List[str]]:
         """Import a specific section of data."""
         imported = 0
@@ -319,37 +420,30 @@ class JSONImporter(BaseImporter):
                 imported += 1
                 
             except Exception as e:
-                errors.append(f"Failed to import {model_name}: {str(e)}")
+                errors.append(f"Failed to import {model_class.__name__}: {str(e)}")
         
         return imported, updated, skipped, errors
     
     def _convert_datetime_fields(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert ISO datetime strings back to datetime objects."""
-        datetime_fields = ["created_at", "updated_at", "date", "timestamp"]
+        """Convert ISO datetime strings back to datetime objects.
         
-        for field in datetime_fields:
-            if field in data and isinstance(data[field], str):
+        The input dict is never modified: a converted copy is returned, or the
+        same dict when there is nothing to convert.
+        """
+        converted = None
+        for field in DT_FIELDS.intersection(data):
+            value = data[field]
+            if isinstance(value, str):
                 try:
-                    data[field] = datetime.fromisoformat(data[field].replace('Z', '+00:00'))
+                    parsed = _parse_iso_datetime(value)
                 except (ValueError, TypeError):
                     # Keep as string if conversion fails
-                    pass
-        
-        return data
-    
-    def _validate_json_types(self, data: Dict[str, Any], errors: List[str]):
-        """Validate JSON-specific data types and constraints."""
-        # Check for null values in required fields
-        if "reportingEvent" in data and data["reportingEvent"]:
-            re_data = data["reportingEvent"]
-            if re_data.get("id") is None:
-                errors.append("Reporting event ID cannot be null")
+                    continue
+                if converted is None:
+                    converted = data.copy()
+                converted[field] = parsed
         
-        # Check arrays are properly formatted
-        array_fields = ["analyses", "methods", "analysisSets", "dataSubsets", "groups", "operations", "outputs", "whereClauses"]
-        for field in array_fields:
-            if field in data and data[field] is not None and not isinstance(data[field], list):
-                errors.append(f"Field '{field}' must be an array or null")
+        return data if converted is None else converted
     
     def _validate_reporting_event(self, re_data: Any) -> List[str]:
         """Validate reporting event data."""
@@ -359,30 +453,15 @@ class JSONImporter(BaseImporter):
             errors.append("Reporting event must be an object")
             return errors
         
-        required_fields = ["id", "name"]
-        errors.extend(self._validate_required_fields(re_data, required_fields))
+        errors.extend(self._validate_required_fields(re_data, REQUIRED_FIELDS))
         
         # JSON-specific validations
-        if "id" in re_data and not isinstance(re_data["id"], str):
+        re_id = re_data.get("id", _MISSING)
+        if re_id is not _MISSING and not isinstance(re_id, str):
             errors.append("Reporting event ID must be a string")
         
         return errors
     
     def _validate_analysis(self, analysis_data: Any, context: str) -> List[str]:
         """Validate analysis data."""
-        errors = []
-        
-        if not isinstance(analysis_data, dict):
-            errors.append(f"{context}: Analysis must be an object")
-            return errors
-        
-        required_fields = ["id", "name"]
-        for field in required_fields:
-            if field not in analysis_data or analysis_data[field] is None:
-                errors.append(f"{context}: Missing required field '{field}'")
-        
-        # JSON-specific validations
-        if "id" in analysis_data and not isinstance(analysis_data["id"], str):
-            errors.append(f"{context}: Analysis ID must be a string")
-        
-        return errors
\ No newline at end of file
+        return _validate_analysis_record(analysis_data, context)
@@ -1,8 +1,9 @@
 """Import/export validation utilities."""
 
+import re
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime
-from pydantic import BaseModel, validator
 from sqlalchemy.orm import Session
 
 from app.models.ars import (
@@ -10,8 +11,12 @@ from app.models.ars import (
     DataSubset, Group, Operation, Output, WhereClause
 )
 
+# Compiled once and shared by every "format" rule that validates an ID
+ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
 
-class ValidationRule(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class ValidationRule:
     """A validation rule for import/export data."""
     field_name: str
     rule_type: str  # required, type, format, range, unique, foreign_key
@@ -19,7 +24,8 @@ class ValidationRule(BaseModel):
     error_message: Optional[str] = None
 
 
-class ValidationResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ValidationResult:
     """Result of a validation check."""
     is_valid: bool
     field_name: str
@@ -49,9 +55,18 @@ class ImportValidator:
         
         rules = self.validation_rules[data_type]
         
+        # Required-field rules run first; value rules are skipped once a
+        # required field is known to be missing.
         for rule in rules:
-            result = self._apply_validation_rule(data, rule)
-            results.append(result)
+            if rule.rule_type == "required":
+                results.append(self._apply_validation_rule(data, rule))
+        
+        if not all(result.is_valid for result in results):
+            return False, results
+        
+        for rule in rules:
+            if rule.rule_type != "required":
+                results.append(self._apply_validation_rule(data, rule))
         
         is_valid = all(result.is_valid for result in results)
         
@@ -72,37 +87,60 @@ class ImportValidator:
     
     def validate_foreign_keys(self, data: Dict[str, Any]) -> List[ValidationResult]:
         """Validate foreign key references."""
-        results = []
+        return self.validate_batch_foreign_keys([data])[0]
+    
+    def validate_batch_foreign_keys(self, data_list: List[Dict[str, Any]]) -> List[List[ValidationResult]]:
+        """Validate foreign key references for a batch of data items.
+        
+        Referenced IDs are collected across the whole batch and checked with
+        one IN query per referenced table instead of one query per item.
+        """
+        re_ids = {data["reporting_event_id"] for data in data_list if data.get("reporting_event_id")}
+        method_ids = {data["method_id"] for data in data_list if data.get("method_id")}
+        
+        existing_re_ids = set()
+        if re_ids:
+            existing_re_ids = {
+                row.id for row in self.db.query(ReportingEvent.id).filter(ReportingEvent.id.in_(re_ids)).all()
+            }
+        
+        existing_method_ids = set()
+        if method_ids:
+            existing_method_ids = {
+                row.id for row in self.db.query(AnalysisMethod.id).filter(AnalysisMethod.id.in_(method_ids)).all()
+            }
         
-        # Check reporting event reference
-        if "reporting_event_id" in data and data["reporting_event_id"]:
-            exists = self.db.query(ReportingEvent).filter(
-                ReportingEvent.id == data["reporting_event_id"]
-            ).first() is not None
+        all_results = []
+        for data in data_list:
+            results = []
+            
+            # Check reporting event reference
+            if data.get("reporting_event_id"):
+                exists = data["reporting_event_id"] in existing_re_ids
+                
+                results.append(ValidationResult(
+                    is_valid=exists,
+                    field_name="reporting_event_id",
+                    rule_type="foreign_key",
+                    error_message=f"Reporting event {data['reporting_event_id']} does not exist" if not exists else "",
+                    value=data["reporting_event_id"]
+                ))
             
-            results.append(ValidationResult(
-                is_valid=exists,
-                field_name="reporting_event_id",
-                rule_type="foreign_key",
-                error_message=f"Reporting event {data['reporting_event_id']} does not exist" if not exists else "",
-                value=data["reporting_event_id"]
-            ))
-        
-        # Check method reference
-        if "method_id" in data and data["method_id"]:
-            exists = self.db.query(AnalysisMethod).filter(
-                AnalysisMethod.id == data["method_id"]
-            ).first() is not None
+            # Check method reference
+            if data.get("method_id"):
+                exists = data["method_id"] in existing_method_ids
+                
+                results.append(ValidationResult(
+                    is_valid=exists,
+                    field_name="method_id", 
+                    rule_type="foreign_key",
+                    error_message=f"Analysis method {data['method_id']} does not exist" if not exists else "",
+                    value=data["method_id"]
+                ))
             
-            results.append(ValidationResult(
-                is_valid=exists,
-                field_name="method_id", 
-                rule_type="foreign_key",
-                error_message=f"Analysis method {data['method_id']} does not exist" if not exists else "",
-                value=data["method_id"]
-            ))
+            all_results.append(results)
         
-        return results
+        return all_results
     
     def validate_data_integrity(self, data: Dict[str, Any]) -> List[ValidationResult]:
         """Validate data integrity constraints."""
@@ -159,9 +197,10 @@ class ImportValidator:
             error_msg = rule.error_message or f"Field '{rule.field_name}' must be of type {expected_type.__name__}"
             
         elif rule.rule_type == "format":
-            import re
             pattern = rule.parameters.get("pattern")
-            is_valid = bool(re.match(pattern, str(field_value))) if field_value is not None else True
+            if isinstance(pattern, str):
+                pattern = re.compile(pattern)
+            is_valid = bool(pattern.match(str(field_value))) if field_value is not None else True
             error_msg = rule.error_message or f"Field '{rule.field_name}' format is invalid"
             
         elif rule.rule_type == "range":
@@ -212,7 +251,7 @@ class ImportValidator:
                 ValidationRule(
                     field_name="id",
                     rule_type="format",
-                    parameters={"pattern": r"^[a-zA-Z0-9_-]+$"},
+                    parameters={"pattern": ID_PATTERN},
                     error_message="ID must contain only alphanumeric characters, underscores, and hyphens"
                 )
             ],
@@ -230,7 +269,7 @@ class ImportValidator:
                 ValidationRule(
                     field_name="id",
                     rule_type="format",
-                    parameters={"pattern": r"^[a-zA-Z0-9_-]+$"},
+                    parameters={"pattern": ID_PATTERN},
                     error_message="ID must contain only alphanumeric characters, underscores, and hyphens"
                 )
             ],
@@ -299,10 +338,10 @@ class ExportValidator:
                 warnings.append("Reporting event name is missing")
         
         # Check for missing relationships
+        method_ids = {m.get("id") for m in data["methods"]} if "methods" in data else None
         for analysis in data.get("analyses", []):
-            if analysis.get("method_id") and "methods" in data:
-                method_found = any(m.get("id") == analysis["method_id"] for m in data["methods"])
-                if not method_found:
+            if analysis.get("method_id") and method_ids is not None:
+                if analysis["method_id"] not in method_ids:
                     warnings.append(f"Method {analysis['method_id']} referenced but not included in export")
         
         return True, warnings  # Warnings don't make export invalid
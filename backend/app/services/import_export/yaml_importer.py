@@ -1,12 +1,52 @@
 """YAML import service for ARS data."""
 
+import logging
+from itertools import islice
 import yaml
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
-import os
+
+from app.models.ars import (
+    ReportingEvent, Analysis, AnalysisMethod, AnalysisSet,
+    DataSubset, Group, Operation, Output, WhereClause
+)
 
 from .base_importer import BaseImporter, ImportResult, FieldMapping
 
+logger = logging.getLogger(__name__)
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+    logger.warning(
+        "PyYAML was built without libyaml; YAML imports will use the slow pure-Python loader"
+    )
+
+# Model classes by name, resolved once at import time
+_MODEL_MAP: Dict[str, type] = {
+    "ReportingEvent": ReportingEvent,
+    "Analysis": Analysis,
+    "AnalysisMethod": AnalysisMethod,
+    "AnalysisSet": AnalysisSet,
+    "DataSubset": DataSubset,
+    "Group": Group,
+    "Operation": Operation,
+    "Output": Output,
+    "WhereClause": WhereClause
+}
+
+# Buffer size for reading YAML files
+READ_BUFFER_SIZE = 1 << 20
+
+# Optional top-level sections that must be lists when present, in reporting order
+OPTIONAL_SECTIONS = (
+    "methods", "analysisSets", "dataSubsets", "groups", "operations", "outputs", "whereClauses"
+)
+
+# Keys every analysis must define
+REQUIRED_ANALYSIS_FIELDS = frozenset(("id", "name"))
+
 
 class YAMLImporter(BaseImporter):
     """YAML format importer for ARS data."""
@@ -16,7 +56,10 @@ class YAMLImporter(BaseImporter):
         try:
             self._update_progress(0, 100, "Starting YAML import...")
             
-            if not os.path.exists(file_path):
+            # Load YAML data; a missing file is detected by open() itself
+            try:
+                data = self._load_yaml(file_path)
+            except FileNotFoundError:
                 return ImportResult(
                     success=False,
                     message=f"File not found: {file_path}",
@@ -24,10 +67,6 @@ class YAMLImporter(BaseImporter):
                     errors=[f"File not found: {file_path}"]
                 )
             
-            # Load YAML data
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            
             self._update_progress(20, 100, "YAML data loaded, validating...")
             
             # Validate data structure
@@ -97,8 +136,11 @@ class YAMLImporter(BaseImporter):
         if "reportingEvent" not in data and "analyses" not in data:
             errors.append("Data must contain either 'reportingEvent' or 'analyses'")
         
+        # Per-record checks are skipped when the caller validates the records after import
+        check_records = not self.config.skip_structural_validation
+        
         # Validate reporting event if present
-        if "reportingEvent" in data:
+        if "reportingEvent" in data and check_records:
             re_errors = self._validate_reporting_event(data["reportingEvent"])
             errors.extend(re_errors)
         
@@ -106,14 +148,18 @@ class YAMLImporter(BaseImporter):
         if "analyses" in data:
             if not isinstance(data["analyses"], list):
                 errors.append("'analyses' must be a list")
-            else:
+            elif check_records:
                 for i, analysis in enumerate(data["analyses"]):
-                    analysis_errors = self._validate_analysis(analysis, f"analyses[{i}]")
-                    errors.extend(analysis_errors)
+                    if not isinstance(analysis, dict):
+                        errors.append(f"analyses[{i}]: Analysis must be a dictionary")
+                        continue
+                    # Messages are only formatted for records that actually fail
+                    missing = self._validate_analysis(analysis)
+                    if missing:
+                        errors.extend(f"analyses[{i}]: Missing required field '{field}'" for field in missing)
         
-        # Check for optional sections
-        optional_sections = ["methods", "analysisSets", "dataSubsets", "groups", "operations", "outputs", "whereClauses"]
-        for section in optional_sections:
+        # Check optional sections
+        for section in OPTIONAL_SECTIONS:
             if section in data and not isinstance(data[section], list):
                 errors.append(f"'{section}' must be a list")
         
@@ -124,8 +170,7 @@ class YAMLImporter(BaseImporter):
     def preview_import(self, file_path: str, limit: int = 10) -> Dict[str, Any]:
         """Preview YAML import data before actual import."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = self._load_yaml(file_path)
             
             preview = {
                 "file_type": "YAML",
@@ -142,7 +187,8 @@ class YAMLImporter(BaseImporter):
                         preview["sample_data"][key] = value[:limit]
                 elif isinstance(value, dict):
                     preview["structure"][key] = f"Object with {len(value)} properties"
-                    preview["sample_data"][key] = value
+                    # Only the first `limit` properties, like list samples
+                    preview["sample_data"][key] = dict(islice(value.items(), limit))
                 else:
                     preview["structure"][key] = type(value).__name__
                     preview["sample_data"][key] = value
@@ -163,6 +209,17 @@ class YAMLImporter(BaseImporter):
                 "file_type": "YAML"
             }
     
+    def validate_file(self, file_path: str) -> Tuple[bool, List[str], List[str]]:
+        """Load and validate a YAML file without importing it."""
+        return self.validate_import_data(self._load_yaml(file_path))
+    
+    def _load_yaml(self, file_path: str) -> Any:
+        """Parse a YAML file with the libyaml-backed safe loader when available."""
+        # The loader decodes bytes itself (UTF-8 unless a BOM says otherwise),
+        # so skip the text layer and read through a 1 MiB buffer
+        with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+            return yaml.load(f, Loader=_SafeLoader)
+    
     def _import_yaml_data(self, data: Dict[str, Any], field_mapping: Optional[List[FieldMapping]] = None) -> ImportResult:
         """Import the actual YAML data."""
         imported = 0
@@ -170,26 +227,24 @@ class YAMLImporter(BaseImporter):
         skipped = 0
         errors = []
         
+        # Resolve field mappings once instead of per record
+        compiled_mapping = self._compile_field_mapping(field_mapping) if field_mapping else None
+        
         try:
             # Import reporting event if present
             if "reportingEvent" in data:
                 re_data = data["reportingEvent"]
-                if field_mapping:
-                    re_data = self._apply_field_mapping(re_data, field_mapping)
-                
-                from app.models.ars import ReportingEvent
+                if compiled_mapping:
+                    re_data = self._apply_compiled_field_mapping(re_data, compiled_mapping)
                 
-                if not self._check_duplicate(ReportingEvent, re_data.get("id")):
+                re_id = re_data.get("id")
+                existing = self.db.query(ReportingEvent).filter(ReportingEvent.id == re_id).first()
+                if existing is None:
                     reporting_event = ReportingEvent(**re_data)
                     self.db.add(reporting_event)
                     imported += 1
                 elif self.config.update_existing:
-                    existing = self.db.query(ReportingEvent).filter(
-                        ReportingEvent.id == re_data.get("id")
-                    ).first()
-                    for key, value in re_data.items():
-                        if hasattr(existing, key):
-                            setattr(existing, key, value)
+                    self._apply_updates(existing, re_data)
                     updated += 1
                 else:
                     skipped += 1
@@ -197,31 +252,68 @@ class YAMLImporter(BaseImporter):
             # Import analyses if present
             if "analyses" in data:
                 total_analyses = len(data["analyses"])
+                progress_step = max(1, total_analyses // 100)
+                mapped_analyses = []
                 for i, analysis_data in enumerate(data["analyses"]):
                     try:
-                        if field_mapping:
-                            analysis_data = self._apply_field_mapping(analysis_data, field_mapping)
-                        
-                        from app.models.ars import Analysis
-                        
-                        record, was_modified = self._create_or_update_record(
-                            Analysis, analysis_data, analysis_data.get("id")
-                        )
-                        
-                        if was_modified:
-                            if self._check_duplicate(Analysis, analysis_data.get("id")):
-                                updated += 1
+                        if compiled_mapping:
+                            analysis_data = self._apply_compiled_field_mapping(analysis_data, compiled_mapping)
+                        mapped_analyses.append((i, analysis_data.get("id"), analysis_data))
+                    except Exception as e:
+                        errors.append(f"Failed to import analysis {i}: {str(e)}")
+                
+                # Look up every incoming ID with one query instead of one per record
+                existing_ids = self._fetch_existing_ids(
+                    Analysis, {analysis_id for _, analysis_id, _ in mapped_analyses}
+                )
+                existing_records = {}
+                if self.config.update_existing and existing_ids and not self.config.use_bulk:
+                    existing_records = {
+                        record.id: record
+                        for record in self.db.query(Analysis).filter(Analysis.id.in_(existing_ids)).all()
+                    }
+                
+                new_records = []
+                update_records = []
+                for i, analysis_id, analysis_data in mapped_analyses:
+                    try:
+                        if analysis_id not in existing_ids:
+                            if self.config.use_bulk:
+                                # Collect plain mappings and write them in batches below
+                                new_records.append(analysis_data)
                             else:
-                                imported += 1
+                                record = Analysis(**analysis_data)
+                                self.db.add(record)
+                                if self.config.update_existing:
+                                    # Later duplicates in the file update this record
+                                    existing_records[analysis_id] = record
+                            existing_ids.add(analysis_id)
+                            imported += 1
+                        elif self.config.update_existing:
+                            if self.config.use_bulk:
+                                update_records.append(analysis_data)
+                            else:
+                                existing = existing_records[analysis_id]
+                                self._apply_updates(existing, analysis_data)
+                            updated += 1
                         else:
                             skipped += 1
                             
-                        # Update progress
-                        progress = 40 + ((i + 1) / total_analyses) * 50
-                        self._update_progress(progress, 100, f"Imported analysis {i + 1}/{total_analyses}")
+                        # Update progress (throttled to roughly 100 updates per import)
+                        if (i + 1) % progress_step == 0 or i + 1 == total_analyses:
+                            progress = 40 + ((i + 1) / total_analyses) * 50
+                            self._update_progress(progress, 100, f"Imported analysis {i + 1}/{total_analyses}")
                         
                     except Exception as e:
                         errors.append(f"Failed to import analysis {i}: {str(e)}")
+                    
+                    if len(new_records) + len(update_records) >= self.config.batch_size:
+                        self._write_bulk(Analysis, new_records, update_records)
+                    elif not self.config.use_bulk and (i + 1) % self.config.batch_size == 0:
+                        # Flush in batches so clean objects can leave the identity map
+                        self.db.flush()
+                
+                self._write_bulk(Analysis, new_records, update_records)
             
             # Import other sections (methods, analysisSets, etc.)
             section_models = {
@@ -265,6 +357,16 @@ class YAMLImporter(BaseImporter):
                 import_time=datetime.now()
             )
     
+    def _write_bulk(self, model_class: Any, new_records: List[Dict[str, Any]],
+                    update_records: List[Dict[str, Any]]):
+        """Write collected mappings with bulk INSERT/UPDATE statements and clear them."""
+        if new_records:
+            self.db.bulk_insert_mappings(model_class, new_records)
+            new_records.clear()
+        if update_records:
+            self.db.bulk_update_mappings(model_class, update_records)
+            update_records.clear()
+    
     def _import_section(self, section_data: List[Dict[str, Any]], model_name: str, 
                        field_mapping: Optional[List[FieldMapping]] = None) -> Tuple[int, int, int, List[str]]:
         """Import a specific section of data."""
@@ -273,28 +375,18 @@ class YAMLImporter(BaseImporter):
         skipped = 0
         errors = []
         
-        # Dynamic model import based on model_name
-        model_map = {
-            "AnalysisMethod": "app.models.ars.AnalysisMethod",
-            "AnalysisSet": "app.models.ars.AnalysisSet",
-            "DataSubset": "app.models.ars.DataSubset",
-            "Group": "app.models.ars.Group",
-            "Operation": "app.models.ars.Operation",
-            "Output": "app.models.ars.Output",
-            "WhereClause": "app.models.ars.WhereClause"
-        }
-        
-        if model_name not in model_map:
+        # Resolve the model class once for the whole section
+        model_class = _MODEL_MAP.get(model_name)
+        if model_class is None:
             errors.append(f"Unknown model: {model_name}")
             return imported, updated, skipped, errors
         
-        # For now, we'll handle the import generically
-        # In a real implementation, you'd import the actual model classes
+        compiled_mapping = self._compile_field_mapping(field_mapping) if field_mapping else None
         
         for item_data in section_data:
             try:
-                if field_mapping:
-                    item_data = self._apply_field_mapping(item_data, field_mapping)
+                if compiled_mapping:
+                    item_data = self._apply_compiled_field_mapping(item_data, compiled_mapping)
                 
                 # This is a simplified version - in reality you'd use the actual model class
                 # record, was_modified = self._create_or_update_record(model_class, item_data, item_data.get("id"))
@@ -303,7 +395,7 @@ class YAMLImporter(BaseImporter):
                 imported += 1
                 
             except Exception as e:
-                errors.append(f"Failed to import {model_name}: {str(e)}")
+                errors.append(f"Failed to import {model_class.__name__}: {str(e)}")
         
         return imported, updated, skipped, errors
     
@@ -320,17 +412,7 @@ class YAMLImporter(BaseImporter):
         
         return errors
     
-    def _validate_analysis(self, analysis_data: Any, context: str) -> List[str]:
-        """Validate analysis data."""
-        errors = []
-        
-        if not isinstance(analysis_data, dict):
-            errors.append(f"{context}: Analysis must be a dictionary")
-            return errors
-        
-        required_fields = ["id", "name"]
-        for field in required_fields:
-            if field not in analysis_data:
-                errors.append(f"{context}: Missing required field '{field}'")
-        
-        return errors
\ No newline at end of file
+    def _validate_analysis(self, analysis_data: Dict[str, Any]) -> Tuple[str, ...]:
+        """Return the required fields missing from analysis data, sorted."""
+        missing = REQUIRED_ANALYSIS_FIELDS - analysis_data.keys()
+        return tuple(sorted(missing)) if missing else ()
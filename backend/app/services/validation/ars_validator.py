@@ -2,16 +2,96 @@
 ARS (Analysis Results Standard) compliance validator.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 from .base_validator import (
     BaseValidator, ValidationResult, ValidationSeverity, 
     ValidationCategory, ValidationContext
 )
 
 
+# Enum members used by every ARS result, bound once as module globals
+_CAT = ValidationCategory.STANDARDS_COMPLIANCE
+_SEV_CRIT = ValidationSeverity.CRITICAL
+_SEV_ERR = ValidationSeverity.ERROR
+_SEV_WARN = ValidationSeverity.WARNING
+
+
+# Standard ARS terminology, listed in the order used in error messages
+_PURPOSE_TERMS = (
+    "PRIMARY_EFFICACY", "SECONDARY_EFFICACY", "SAFETY", "EXPLORATORY",
+    "PHARMACOKINETIC", "PHARMACODYNAMIC", "BIOMARKER", "OTHER"
+)
+_REASON_TERMS = (
+    "REGULATORY_REQUIREMENT", "PROTOCOL_SPECIFIED", "SPONSOR_INTEREST",
+    "INVESTIGATOR_REQUEST", "SAFETY_MONITORING", "OTHER"
+)
+_PROG_CONTEXT_TERMS = ("SAS", "R", "Python", "SQL", "Other")
+
+_VALID_PURPOSES = frozenset(_PURPOSE_TERMS)
+_VALID_REASONS = frozenset(_REASON_TERMS)
+_VALID_PROG_CONTEXTS = frozenset(_PROG_CONTEXT_TERMS)
+
+_VALID_PURPOSES_STR = f"One of: {', '.join(_PURPOSE_TERMS)}"
+_VALID_REASONS_STR = f"One of: {', '.join(_REASON_TERMS)}"
+_VALID_PROG_CONTEXTS_STR = f"One of: {', '.join(_PROG_CONTEXT_TERMS)}"
+
+# Required reporting event metadata (ARS_001)
+_RE_REQUIRED = ("id", "name", "version", "analyses")
+
+# Required keys, in reporting order, with frozensets for the missing-key diff
+_PROG_CODE_FIELDS = ("context", "code")
+_FILE_SPEC_FIELDS = ("name", "fileType")
+_WC_COND_FIELDS = ("dataset", "variable", "comparator")
+
+_PROG_CODE_REQUIRED = frozenset(_PROG_CODE_FIELDS)
+_FILE_SPEC_REQUIRED = frozenset(_FILE_SPEC_FIELDS)
+_WC_COND_REQUIRED = frozenset(_WC_COND_FIELDS)
+
+# Fixed create_result arguments for the ID format rules; suggestions are
+# tuples so every result can share them
+_ARS002_KW = {
+    "rule_id": "ars_002",
+    "category": _CAT,
+    "severity": _SEV_ERR,
+    "message": "Analysis ID does not follow ARS naming conventions",
+    "field_path": "id",
+    "suggestions": (
+        "Use format: AN_[study]_[sequence]_[description]",
+        "Example: AN_STUDY01_01_DEMOG"
+    )
+}
+_ARS003_KW = {
+    "rule_id": "ars_003",
+    "category": _CAT,
+    "severity": _SEV_ERR,
+    "message": "Output ID does not follow ARS naming conventions",
+    "field_path": "id",
+    "suggestions": (
+        "Use format: OUT_[study]_[sequence]_[description]",
+        "Example: OUT_STUDY01_01_DEMO_TABLE"
+    )
+}
+_ARS004_KW = {
+    "rule_id": "ars_004",
+    "category": _CAT,
+    "severity": _SEV_ERR,
+    "message": "Method ID does not follow ARS naming conventions",
+    "field_path": "id",
+    "suggestions": (
+        "Use format: MT_[study]_[sequence]_[description]",
+        "Example: MT_STUDY01_01_DESCRIPTIVE"
+    )
+}
+
+
 class ARSValidator(BaseValidator):
     """Validator for ARS standard compliance."""
     
+    # ARS ID conventions: <PREFIX>_[study]_[sequence]_[description]
+    ANALYSIS_ID_PREFIX = "AN_"
+    METHOD_ID_PREFIX = "MT_"
+    OUTPUT_ID_PREFIX = "OUT_"
+    
     def __init__(self):
         super().__init__("ARS Validator")
         self.ars_rules = {
@@ -31,6 +111,15 @@ class ARSValidator(BaseValidator):
             "ars_014": "Result group structure",
             "ars_015": "Output file specifications"
         }
+        
+        # Object type -> validation handler
+        self._dispatch = {
+            "reporting_event": self._validate_reporting_event,
+            "analysis": self._validate_analysis,
+            "method": self._validate_method,
+            "output": self._validate_output,
+            "where_clause": self._validate_where_clause
+        }
     
     def get_supported_rules(self) -> List[str]:
         """Get list of supported ARS validation rules."""
@@ -38,486 +127,413 @@ class ARSValidator(BaseValidator):
     
     def validate(self, data: Any, context: ValidationContext) -> List[ValidationResult]:
         """Validate ARS compliance."""
-        results = []
-        
         if not isinstance(data, dict):
-            results.append(self.create_result(
-                rule_id="ars_000",
-                rule_name="Data Format",
-                category=ValidationCategory.STANDARDS_COMPLIANCE,
-                severity=ValidationSeverity.CRITICAL,
-                message="ARS data must be provided as a dictionary/object",
-                value=type(data).__name__,
-                expected_value="dict"
-            ))
-            return results
-        
-        # Validate based on object type
-        if context.object_type == "reporting_event":
-            results.extend(self._validate_reporting_event(data, context))
-        elif context.object_type == "analysis":
-            results.extend(self._validate_analysis(data, context))
-        elif context.object_type == "method":
-            results.extend(self._validate_method(data, context))
-        elif context.object_type == "output":
-            results.extend(self._validate_output(data, context))
-        elif context.object_type == "where_clause":
-            results.extend(self._validate_where_clause(data, context))
+            return [self._data_format_result(data)]
         
-        return results
+        return list(self._iter_results(data, context, self._disabled_rules))
     
-    def _validate_reporting_event(self, data: Dict[str, Any], context: ValidationContext) -> List[ValidationResult]:
+    def iter_validate(self, data: Any, context: ValidationContext) -> Iterator[ValidationResult]:
+        """Yield ARS compliance results lazily."""
+        if not isinstance(data, dict):
+            yield self._data_format_result(data)
+        else:
+            yield from self._iter_results(data, context, self._disabled_rules)
+    
+    def validate_many(
+        self,
+        items: Iterable[Tuple[Any, ValidationContext]]
+    ) -> Iterator[Tuple[ValidationContext, List[ValidationResult]]]:
+        """
+        Validate several objects, yielding (context, results) per item.
+        
+        The disabled-rule set is read once for the whole batch, so rule
+        configuration changes made while iterating do not apply to it.
+        """
+        disabled_rules = self._disabled_rules
+        
+        for data, context in items:
+            if not isinstance(data, dict):
+                yield context, [self._data_format_result(data)]
+            else:
+                yield context, list(self._iter_results(data, context, disabled_rules))
+    
+    def _data_format_result(self, data: Any) -> ValidationResult:
+        """Result for data that is not a dictionary."""
+        return self.create_result(
+            rule_id="ars_000",
+            rule_name="Data Format",
+            category=_CAT,
+            severity=_SEV_CRIT,
+            message="ARS data must be provided as a dictionary/object",
+            value=type(data).__name__,
+            expected_value="dict"
+        )
+    
+    def _iter_results(self, data: Dict[str, Any], context: ValidationContext,
+                      disabled_rules: FrozenSet[str]) -> Iterator[ValidationResult]:
+        """Yield the results of the handler registered for the object type."""
+        handler = self._dispatch.get(context.object_type)
+        if handler:
+            yield from handler(data, context, disabled_rules)
+    
+    def _validate_reporting_event(self, data: Dict[str, Any], context: ValidationContext,
+                                  disabled_rules: FrozenSet[str]) -> Iterator[ValidationResult]:
         """Validate reporting event ARS compliance."""
-        results = []
-        
         # Rule ARS_001: Required metadata fields
-        if self.is_rule_enabled("ars_001"):
-            required_fields = ["id", "name", "version", "analyses"]
-            for field in required_fields:
-                result = self.validate_required_field(
-                    data, field, "ars_001", self.ars_rules["ars_001"],
-                    ValidationCategory.STANDARDS_COMPLIANCE
-                )
-                if result:
-                    results.append(result)
+        if "ars_001" not in disabled_rules:
+            yield from self.validate_required_fields(
+                data, _RE_REQUIRED, "ars_001", self.ars_rules["ars_001"],
+                _CAT
+            )
         
         # Rule ARS_008: Display section hierarchy
-        if self.is_rule_enabled("ars_008") and "listOfContents" in data:
-            results.extend(self._validate_display_sections(data["listOfContents"]))
+        if "ars_008" not in disabled_rules and "listOfContents" in data:
+            yield from self._validate_display_sections(data["listOfContents"])
         
         # Rule ARS_009: Reference document links
-        if self.is_rule_enabled("ars_009") and "referenceDocuments" in data:
-            results.extend(self._validate_reference_documents(data["referenceDocuments"]))
-        
-        return results
+        if "ars_009" not in disabled_rules and "referenceDocuments" in data:
+            yield from self._validate_reference_documents(data["referenceDocuments"])
     
-    def _validate_analysis(self, data: Dict[str, Any], context: ValidationContext) -> List[ValidationResult]:
+    def _validate_analysis(self, data: Dict[str, Any], context: ValidationContext,
+                           disabled_rules: FrozenSet[str]) -> Iterator[ValidationResult]:
         """Validate analysis ARS compliance."""
-        results = []
-        
         # Rule ARS_002: Analysis ID format validation
-        if self.is_rule_enabled("ars_002"):
+        if "ars_002" not in disabled_rules:
             if "id" in data:
                 if not self._is_valid_analysis_id(data["id"]):
-                    results.append(self.create_result(
-                        rule_id="ars_002",
-                        rule_name=self.ars_rules["ars_002"],
-                        category=ValidationCategory.STANDARDS_COMPLIANCE,
-                        severity=ValidationSeverity.ERROR,
-                        message="Analysis ID does not follow ARS naming conventions",
-                        field_path="id",
-                        value=data["id"],
-                        suggestions=[
-                            "Use format: AN_[study]_[sequence]_[description]",
-                            "Example: AN_STUDY01_01_DEMOG"
-                        ]
-                    ))
+                    yield self.create_result(
+                        **_ARS002_KW, rule_name=self.ars_rules["ars_002"], value=data["id"]
+                    )
         
         # Rule ARS_005: Analysis set references
-        if self.is_rule_enabled("ars_005") and "analysisSetId" in data:
-            results.extend(self._validate_analysis_set_reference(data["analysisSetId"]))
+        if "ars_005" not in disabled_rules and "analysisSetId" in data:
+            yield from self._validate_analysis_set_reference(data["analysisSetId"])
         
         # Rule ARS_011: Analysis purpose validation
-        if self.is_rule_enabled("ars_011") and "purpose" in data:
-            results.extend(self._validate_analysis_purpose(data["purpose"]))
+        if "ars_011" not in disabled_rules and "purpose" in data:
+            yield from self._validate_analysis_purpose(data["purpose"])
         
         # Rule ARS_012: Analysis reason validation
-        if self.is_rule_enabled("ars_012") and "reason" in data:
-            results.extend(self._validate_analysis_reason(data["reason"]))
-        
-        return results
+        if "ars_012" not in disabled_rules and "reason" in data:
+            yield from self._validate_analysis_reason(data["reason"])
     
-    def _validate_method(self, data: Dict[str, Any], context: ValidationContext) -> List[ValidationResult]:
+    def _validate_method(self, data: Dict[str, Any], context: ValidationContext,
+                         disabled_rules: FrozenSet[str]) -> Iterator[ValidationResult]:
         """Validate method ARS compliance."""
-        results = []
-        
         # Rule ARS_004: Method ID format validation
-        if self.is_rule_enabled("ars_004"):
+        if "ars_004" not in disabled_rules:
             if "id" in data:
                 if not self._is_valid_method_id(data["id"]):
-                    results.append(self.create_result(
-                        rule_id="ars_004",
-                        rule_name=self.ars_rules["ars_004"],
-                        category=ValidationCategory.STANDARDS_COMPLIANCE,
-                        severity=ValidationSeverity.ERROR,
-                        message="Method ID does not follow ARS naming conventions",
-                        field_path="id",
-                        value=data["id"],
-                        suggestions=[
-                            "Use format: MT_[study]_[sequence]_[description]",
-                            "Example: MT_STUDY01_01_DESCRIPTIVE"
-                        ]
-                    ))
+                    yield self.create_result(
+                        **_ARS004_KW, rule_name=self.ars_rules["ars_004"], value=data["id"]
+                    )
         
         # Rule ARS_007: Programming code template validation
-        if self.is_rule_enabled("ars_007") and "operations" in data:
+        if "ars_007" not in disabled_rules and "operations" in data:
             for i, operation in enumerate(data["operations"]):
                 if "programmingCode" in operation:
-                    results.extend(self._validate_programming_code(
-                        operation["programmingCode"], f"operations[{i}].programmingCode"
-                    ))
-        
-        return results
+                    yield from self._validate_programming_code(operation["programmingCode"], i)
     
-    def _validate_output(self, data: Dict[str, Any], context: ValidationContext) -> List[ValidationResult]:
+    def _validate_output(self, data: Dict[str, Any], context: ValidationContext,
+                         disabled_rules: FrozenSet[str]) -> Iterator[ValidationResult]:
         """Validate output ARS compliance."""
-        results = []
-        
         # Rule ARS_003: Output ID format validation
-        if self.is_rule_enabled("ars_003"):
+        if "ars_003" not in disabled_rules:
             if "id" in data:
                 if not self._is_valid_output_id(data["id"]):
-                    results.append(self.create_result(
-                        rule_id="ars_003",
-                        rule_name=self.ars_rules["ars_003"],
-                        category=ValidationCategory.STANDARDS_COMPLIANCE,
-                        severity=ValidationSeverity.ERROR,
-                        message="Output ID does not follow ARS naming conventions",
-                        field_path="id",
-                        value=data["id"],
-                        suggestions=[
-                            "Use format: OUT_[study]_[sequence]_[description]",
-                            "Example: OUT_STUDY01_01_DEMO_TABLE"
-                        ]
-                    ))
+                    yield self.create_result(
+                        **_ARS003_KW, rule_name=self.ars_rules["ars_003"], value=data["id"]
+                    )
         
         # Rule ARS_015: Output file specifications
-        if self.is_rule_enabled("ars_015") and "fileSpecifications" in data:
-            results.extend(self._validate_file_specifications(data["fileSpecifications"]))
+        if "ars_015" not in disabled_rules and "fileSpecifications" in data:
+            yield from self._validate_file_specifications(data["fileSpecifications"])
         
         # Rule ARS_014: Result group structure
-        if self.is_rule_enabled("ars_014") and "resultGroups" in data:
-            results.extend(self._validate_result_groups(data["resultGroups"]))
-        
-        return results
+        if "ars_014" not in disabled_rules and "resultGroups" in data:
+            yield from self._validate_result_groups(data["resultGroups"])
     
-    def _validate_where_clause(self, data: Dict[str, Any], context: ValidationContext) -> List[ValidationResult]:
+    def _validate_where_clause(self, data: Dict[str, Any], context: ValidationContext,
+                               disabled_rules: FrozenSet[str]) -> Iterator[ValidationResult]:
         """Validate where clause ARS compliance."""
-        results = []
-        
         # Rule ARS_006: Where clause structure
-        if self.is_rule_enabled("ars_006"):
-            results.extend(self._validate_where_clause_structure(data))
-        
-        return results
+        if "ars_006" not in disabled_rules:
+            yield from self._validate_where_clause_structure(data)
     
     def _is_valid_analysis_id(self, analysis_id: str) -> bool:
         """Check if analysis ID follows ARS conventions."""
-        if not isinstance(analysis_id, str):
-            return False
-        
-        # ARS convention: AN_[study]_[sequence]_[description]
-        parts = analysis_id.split("_")
-        return len(parts) >= 4 and parts[0] == "AN"
+        return (isinstance(analysis_id, str) and analysis_id.startswith(self.ANALYSIS_ID_PREFIX)
+                and analysis_id.count("_") >= 3)
     
     def _is_valid_method_id(self, method_id: str) -> bool:
         """Check if method ID follows ARS conventions."""
-        if not isinstance(method_id, str):
-            return False
-        
-        # ARS convention: MT_[study]_[sequence]_[description]
-        parts = method_id.split("_")
-        return len(parts) >= 4 and parts[0] == "MT"
+        return (isinstance(method_id, str) and method_id.startswith(self.METHOD_ID_PREFIX)
+                and method_id.count("_") >= 3)
     
     def _is_valid_output_id(self, output_id: str) -> bool:
         """Check if output ID follows ARS conventions."""
-        if not isinstance(output_id, str):
-            return False
-        
-        # ARS convention: OUT_[study]_[sequence]_[description]
-        parts = output_id.split("_")
-        return len(parts) >= 4 and parts[0] == "OUT"
+        return (isinstance(output_id, str) and output_id.startswith(self.OUTPUT_ID_PREFIX)
+                and output_id.count("_") >= 3)
     
-    def _validate_analysis_set_reference(self, analysis_set_id: str) -> List[ValidationResult]:
+    def _validate_analysis_set_reference(self, analysis_set_id: str) -> Iterator[ValidationResult]:
         """Validate analysis set reference format."""
-        results = []
-        
         if not isinstance(analysis_set_id, str) or not analysis_set_id.strip():
-            results.append(self.create_result(
+            yield self.create_result(
                 rule_id="ars_005",
                 rule_name=self.ars_rules["ars_005"],
-                category=ValidationCategory.STANDARDS_COMPLIANCE,
-                severity=ValidationSeverity.ERROR,
+                category=_CAT,
+                severity=_SEV_ERR,
                 message="Analysis set ID must be a non-empty string",
                 field_path="analysisSetId",
                 value=analysis_set_id,
                 suggestions=["Provide a valid analysis set identifier"]
-            ))
-        
-        return results
+            )
     
-    def _validate_analysis_purpose(self, purpose: Any) -> List[ValidationResult]:
+    def _validate_analysis_purpose(self, purpose: Any) -> Iterator[ValidationResult]:
         """Validate analysis purpose structure."""
-        results = []
-        
-        valid_purposes = [
-            "PRIMARY_EFFICACY", "SECONDARY_EFFICACY", "SAFETY", "EXPLORATORY",
-            "PHARMACOKINETIC", "PHARMACODYNAMIC", "BIOMARKER", "OTHER"
-        ]
-        
         if isinstance(purpose, str):
-            if purpose not in valid_purposes:
-                results.append(self.create_result(
+            if purpose not in _VALID_PURPOSES:
+                yield self.create_result(
                     rule_id="ars_011",
                     rule_name=self.ars_rules["ars_011"],
-                    category=ValidationCategory.STANDARDS_COMPLIANCE,
-                    severity=ValidationSeverity.WARNING,
+                    category=_CAT,
+                    severity=_SEV_WARN,
                     message=f"Analysis purpose '{purpose}' is not a standard ARS value",
                     field_path="purpose",
                     value=purpose,
-                    expected_value=f"One of: {', '.join(valid_purposes)}",
+                    expected_value=_VALID_PURPOSES_STR,
                     suggestions=["Use a standard ARS analysis purpose or document custom purpose"]
-                ))
+                )
         elif isinstance(purpose, dict):
             # Custom purpose object
             if "controlledTerm" not in purpose and "sponsorTerm" not in purpose:
-                results.append(self.create_result(
+                yield self.create_result(
                     rule_id="ars_011",
                     rule_name=self.ars_rules["ars_011"],
-                    category=ValidationCategory.STANDARDS_COMPLIANCE,
-                    severity=ValidationSeverity.ERROR,
+                    category=_CAT,
+                    severity=_SEV_ERR,
                     message="Custom analysis purpose must specify either controlledTerm or sponsorTerm",
                     field_path="purpose",
                     value=str(purpose),
                     suggestions=["Add controlledTerm or sponsorTerm to purpose object"]
-                ))
-        
-        return results
+                )
     
-    def _validate_analysis_reason(self, reason: Any) -> List[ValidationResult]:
+    def _validate_analysis_reason(self, reason: Any) -> Iterator[ValidationResult]:
         """Validate analysis reason structure."""
-        results = []
-        
-        valid_reasons = [
-            "REGULATORY_REQUIREMENT", "PROTOCOL_SPECIFIED", "SPONSOR_INTEREST",
-            "INVESTIGATOR_REQUEST", "SAFETY_MONITORING", "OTHER"
-        ]
-        
         if isinstance(reason, str):
-            if reason not in valid_reasons:
-                results.append(self.create_result(
+            if reason not in _VALID_REASONS:
+                yield self.create_result(
                     rule_id="ars_012",
                     rule_name=self.ars_rules["ars_012"],
-                    category=ValidationCategory.STANDARDS_COMPLIANCE,
-                    severity=ValidationSeverity.WARNING,
+                    category=_CAT,
+                    severity=_SEV_WARN,
                     message=f"Analysis reason '{reason}' is not a standard ARS value",
                     field_path="reason",
                     value=reason,
-                    expected_value=f"One of: {', '.join(valid_reasons)}",
+                    expected_value=_VALID_REASONS_STR,
                     suggestions=["Use a standard ARS analysis reason or document custom reason"]
-                ))
-        
-        return results
+                )
     
-    def _validate_programming_code(self, prog_code: Dict[str, Any], field_path: str) -> List[ValidationResult]:
-        """Validate programming code structure."""
-        results = []
-        
-        required_fields = ["context", "code"]
-        for field in required_fields:
-            if field not in prog_code:
-                results.append(self.create_result(
-                    rule_id="ars_007",
-                    rule_name=self.ars_rules["ars_007"],
-                    category=ValidationCategory.STANDARDS_COMPLIANCE,
-                    severity=ValidationSeverity.ERROR,
-                    message=f"Programming code missing required field '{field}'",
-                    field_path=f"{field_path}.{field}",
-                    suggestions=[f"Add {field} to programming code specification"]
-                ))
+    def _validate_programming_code(self, prog_code: Dict[str, Any], operation_index: int) -> Iterator[ValidationResult]:
+        """Validate programming code structure of operations[operation_index]."""
+        rule_name = self.ars_rules["ars_007"]
+        
+        # Field paths are only formatted for violations
+        missing = _PROG_CODE_REQUIRED.difference(prog_code)
+        if missing:
+            for field in _PROG_CODE_FIELDS:
+                if field in missing:
+                    yield self.create_result(
+                        rule_id="ars_007",
+                        rule_name=rule_name,
+                        category=_CAT,
+                        severity=_SEV_ERR,
+                        message=f"Programming code missing required field '{field}'",
+                        field_path=f"operations[{operation_index}].programmingCode.{field}",
+                        suggestions=[f"Add {field} to programming code specification"]
+                    )
         
         # Validate context values
         if "context" in prog_code:
-            valid_contexts = ["SAS", "R", "Python", "SQL", "Other"]
-            if prog_code["context"] not in valid_contexts:
-                results.append(self.create_result(
+            prog_context = prog_code["context"]
+            # Non-string contexts (possibly unhashable) are never standard
+            if not isinstance(prog_context, str) or prog_context not in _VALID_PROG_CONTEXTS:
+                yield self.create_result(
                     rule_id="ars_007",
-                    rule_name=self.ars_rules["ars_007"],
-                    category=ValidationCategory.STANDARDS_COMPLIANCE,
-                    severity=ValidationSeverity.WARNING,
+                    rule_name=rule_name,
+                    category=_CAT,
+                    severity=_SEV_WARN,
                     message=f"Programming context '{prog_code['context']}' is not standard",
-                    field_path=f"{field_path}.context",
+                    field_path=f"operations[{operation_index}].programmingCode.context",
                     value=prog_code["context"],
-                    expected_value=f"One of: {', '.join(valid_contexts)}",
+                    expected_value=_VALID_PROG_CONTEXTS_STR,
                     suggestions=["Use a standard programming context"]
-                ))
-        
-        return results
+                )
     
-    def _validate_display_sections(self, list_of_contents: Dict[str, Any]) -> List[ValidationResult]:
+    def _validate_display_sections(self, list_of_contents: Dict[str, Any]) -> Iterator[ValidationResult]:
         """Validate display section hierarchy."""
-        results = []
-        
         if "contentsList" in list_of_contents:
             for i, content in enumerate(list_of_contents["contentsList"]):
                 if "subSections" in content:
                     # Check for circular references and depth limits
-                    results.extend(self._check_section_depth(content["subSections"], f"contentsList[{i}]", 0))
-        
-        return results
+                    yield from self._check_section_depth(content["subSections"], f"contentsList[{i}]", 0)
     
-    def _check_section_depth(self, sections: List[Dict], path: str, depth: int) -> List[ValidationResult]:
+    def _check_section_depth(self, sections: List[Dict], path: str, depth: int) -> Iterator[ValidationResult]:
         """Check section hierarchy depth and structure."""
-        results = []
         max_depth = 5  # ARS recommendation
         
-        if depth > max_depth:
-            results.append(self.create_result(
-                rule_id="ars_008",
-                rule_name=self.ars_rules["ars_008"],
-                category=ValidationCategory.STANDARDS_COMPLIANCE,
-                severity=ValidationSeverity.WARNING,
-                message=f"Display section hierarchy exceeds recommended depth of {max_depth}",
-                field_path=path,
-                value=depth,
-                expected_value=f"<= {max_depth}",
-                suggestions=["Consider flattening the section hierarchy"]
-            ))
-        
-        for i, section in enumerate(sections):
-            if "subSections" in section:
-                results.extend(self._check_section_depth(
-                    section["subSections"], f"{path}.subSections[{i}]", depth + 1
-                ))
-        
-        return results
+        # Depth-first walk with an explicit stack; a subtree that exceeds the
+        # limit is reported once and not descended into any further
+        stack = [(sections, path, depth)]
+        while stack:
+            sections, path, depth = stack.pop()
+            
+            if depth > max_depth:
+                yield self.create_result(
+                    rule_id="ars_008",
+                    rule_name=self.ars_rules["ars_008"],
+                    category=_CAT,
+                    severity=_SEV_WARN,
+                    message=f"Display section hierarchy exceeds recommended depth of {max_depth}",
+                    field_path=path,
+                    value=depth,
+                    expected_value=f"<= {max_depth}",
+                    suggestions=["Consider flattening the section hierarchy"]
+                )
+                continue
+            
+            # Push in reverse so sections are visited in document order
+            for i in range(len(sections) - 1, -1, -1):
+                section = sections[i]
+                if "subSections" in section:
+                    stack.append((section["subSections"], f"{path}.subSections[{i}]", depth + 1))
     
-    def _validate_reference_documents(self, ref_docs: List[Dict[str, Any]]) -> List[ValidationResult]:
+    def _validate_reference_documents(self, ref_docs: List[Dict[str, Any]]) -> Iterator[ValidationResult]:
         """Validate reference document structure."""
-        results = []
+        rule_name = self.ars_rules["ars_009"]
         
         for i, doc in enumerate(ref_docs):
             if "id" not in doc:
-                results.append(self.create_result(
+                yield self.create_result(
                     rule_id="ars_009",
-                    rule_name=self.ars_rules["ars_009"],
-                    category=ValidationCategory.STANDARDS_COMPLIANCE,
-                    severity=ValidationSeverity.ERROR,
+                    rule_name=rule_name,
+                    category=_CAT,
+                    severity=_SEV_ERR,
                     message="Reference document missing required ID",
                     field_path=f"referenceDocuments[{i}].id",
                     suggestions=["Add unique identifier to reference document"]
-                ))
+                )
             
             if "location" not in doc:
-                results.append(self.create_result(
+                yield self.create_result(
                     rule_id="ars_009",
-                    rule_name=self.ars_rules["ars_009"],
-                    category=ValidationCategory.STANDARDS_COMPLIANCE,
-                    severity=ValidationSeverity.WARNING,
+                    rule_name=rule_name,
+                    category=_CAT,
+                    severity=_SEV_WARN,
                     message="Reference document missing location information",
                     field_path=f"referenceDocuments[{i}].location",
                     suggestions=["Add location/URL to reference document"]
-                ))
-        
-        return results
+                )
     
-    def _validate_file_specifications(self, file_specs: List[Dict[str, Any]]) -> List[ValidationResult]:
+    def _validate_file_specifications(self, file_specs: List[Dict[str, Any]]) -> Iterator[ValidationResult]:
         """Validate output file specifications."""
-        results = []
-        
         for i, spec in enumerate(file_specs):
-            required_fields = ["name", "fileType"]
-            for field in required_fields:
-                if field not in spec:
-                    results.append(self.create_result(
-                        rule_id="ars_015",
-                        rule_name=self.ars_rules["ars_015"],
-                        category=ValidationCategory.STANDARDS_COMPLIANCE,
-                        severity=ValidationSeverity.ERROR,
-                        message=f"File specification missing required field '{field}'",
-                        field_path=f"fileSpecifications[{i}].{field}",
-                        suggestions=[f"Add {field} to file specification"]
-                    ))
-        
-        return results
+            missing = _FILE_SPEC_REQUIRED.difference(spec)
+            if missing:
+                for field in _FILE_SPEC_FIELDS:
+                    if field in missing:
+                        yield self.create_result(
+                            rule_id="ars_015",
+                            rule_name=self.ars_rules["ars_015"],
+                            category=_CAT,
+                            severity=_SEV_ERR,
+                            message=f"File specification missing required field '{field}'",
+                            field_path=f"fileSpecifications[{i}].{field}",
+                            suggestions=[f"Add {field} to file specification"]
+                        )
     
-    def _validate_result_groups(self, result_groups: List[Dict[str, Any]]) -> List[ValidationResult]:
+    def _validate_result_groups(self, result_groups: List[Dict[str, Any]]) -> Iterator[ValidationResult]:
         """Validate result group structure."""
-        results = []
-        
         for i, group in enumerate(result_groups):
             if "groupingId" not in group:
-                results.append(self.create_result(
+                yield self.create_result(
                     rule_id="ars_014",
                     rule_name=self.ars_rules["ars_014"],
-                    category=ValidationCategory.STANDARDS_COMPLIANCE,
-                    severity=ValidationSeverity.ERROR,
+                    category=_CAT,
+                    severity=_SEV_ERR,
                     message="Result group missing grouping ID",
                     field_path=f"resultGroups[{i}].groupingId",
                     suggestions=["Add groupingId to result group"]
-                ))
-        
-        return results
+                )
     
-    def _validate_where_clause_structure(self, data: Dict[str, Any]) -> List[ValidationResult]:
+    def _validate_where_clause_structure(self, data: Dict[str, Any]) -> Iterator[ValidationResult]:
         """Validate where clause structure according to ARS standards."""
-        results = []
+        rule_name = self.ars_rules["ars_006"]
         
         # Must have either condition or compoundExpression, but not both
         has_condition = "condition" in data
         has_compound = "compoundExpression" in data
         
         if not has_condition and not has_compound:
-            results.append(self.create_result(
+            yield self.create_result(
                 rule_id="ars_006",
-                rule_name=self.ars_rules["ars_006"],
-                category=ValidationCategory.STANDARDS_COMPLIANCE,
-                severity=ValidationSeverity.ERROR,
+                rule_name=rule_name,
+                category=_CAT,
+                severity=_SEV_ERR,
                 message="Where clause must specify either condition or compoundExpression",
                 suggestions=[
                     "Add a condition for simple criteria",
                     "Add a compoundExpression for complex logic"
                 ]
-            ))
+            )
         elif has_condition and has_compound:
-            results.append(self.create_result(
+            yield self.create_result(
                 rule_id="ars_006",
-                rule_name=self.ars_rules["ars_006"],
-                category=ValidationCategory.STANDARDS_COMPLIANCE,
-                severity=ValidationSeverity.ERROR,
+                rule_name=rule_name,
+                category=_CAT,
+                severity=_SEV_ERR,
                 message="Where clause cannot have both condition and compoundExpression",
                 suggestions=["Use either condition or compoundExpression, not both"]
-            ))
+            )
         
         # Validate condition structure
         if has_condition:
             condition = data["condition"]
-            required_fields = ["dataset", "variable", "comparator"]
-            for field in required_fields:
-                if field not in condition:
-                    results.append(self.create_result(
-                        rule_id="ars_006",
-                        rule_name=self.ars_rules["ars_006"],
-                        category=ValidationCategory.STANDARDS_COMPLIANCE,
-                        severity=ValidationSeverity.ERROR,
-                        message=f"Where clause condition missing required field '{field}'",
-                        field_path=f"condition.{field}",
-                        suggestions=[f"Add {field} to where clause condition"]
-                    ))
+            missing = _WC_COND_REQUIRED.difference(condition)
+            if missing:
+                for field in _WC_COND_FIELDS:
+                    if field in missing:
+                        yield self.create_result(
+                            rule_id="ars_006",
+                            rule_name=rule_name,
+                            category=_CAT,
+                            severity=_SEV_ERR,
+                            message=f"Where clause condition missing required field '{field}'",
+                            field_path=f"condition.{field}",
+                            suggestions=[f"Add {field} to where clause condition"]
+                        )
         
         # Validate compound expression structure
         if has_compound:
             compound = data["compoundExpression"]
             if "logicalOperator" not in compound:
-                results.append(self.create_result(
+                yield self.create_result(
                     rule_id="ars_006",
-                    rule_name=self.ars_rules["ars_006"],
-                    category=ValidationCategory.STANDARDS_COMPLIANCE,
-                    severity=ValidationSeverity.ERROR,
+                    rule_name=rule_name,
+                    category=_CAT,
+                    severity=_SEV_ERR,
                     message="Compound expression missing logical operator",
                     field_path="compoundExpression.logicalOperator",
                     suggestions=["Add logicalOperator (AND, OR, NOT) to compound expression"]
-                ))
+                )
             
             if "whereClauses" not in compound or not compound["whereClauses"]:
-                results.append(self.create_result(
+                yield self.create_result(
                     rule_id="ars_006",
-                    rule_name=self.ars_rules["ars_006"],
-                    category=ValidationCategory.STANDARDS_COMPLIANCE,
-                    severity=ValidationSeverity.ERROR,
+                    rule_name=rule_name,
+                    category=_CAT,
+                    severity=_SEV_ERR,
                     message="Compound expression must contain where clauses",
                     field_path="compoundExpression.whereClauses",
                     suggestions=["Add nested where clauses to compound expression"]
-                ))
-        
-        return results
\ No newline at end of file
+                )
\ No newline at end of file
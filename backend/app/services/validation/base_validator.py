@@ -4,9 +4,11 @@ Base validation framework for all validation services.
 
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Union
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from collections import Counter
 import uuid
 
 
@@ -28,7 +30,45 @@ class ValidationCategory(str, Enum):
     SECURITY = "security"
 
 
-@dataclass
+# Message templates for the shared field helpers
+_REQUIRED_MSG = "Required field '{0}' is missing or empty"
+_REQUIRED_SUGGESTION = "Provide a value for {0}"
+_TYPE_MSG = "Field '{0}' has incorrect type"
+_TYPE_DESCRIPTION = "Expected {0}, got {1}"
+_TYPE_EXPECTED = "Value of type {0}"
+_TYPE_SUGGESTION = "Convert {0} to {1}"
+_BELOW_MIN_MSG = "Field '{0}' value {1} is below minimum {2}"
+_BELOW_MIN_EXPECTED = "Value >= {0}"
+_BELOW_MIN_SUGGESTION = "Increase {0} to at least {1}"
+_ABOVE_MAX_MSG = "Field '{0}' value {1} exceeds maximum {2}"
+_ABOVE_MAX_EXPECTED = "Value <= {0}"
+_ABOVE_MAX_SUGGESTION = "Reduce {0} to at most {1}"
+
+# Types accepted by the numeric range check
+_NUMERIC_TYPES = (int, float)
+_NUMERIC_TYPE_SET = frozenset(_NUMERIC_TYPES)
+
+
+@lru_cache(maxsize=4096)
+def _field_message(template: str, *args: str) -> str:
+    """Format a field message once, so repeated failures share one string."""
+    return template.format(*args)
+
+
+# Severity ordering used to decide when a fail-fast run stops
+SEVERITY_RANK = {
+    ValidationSeverity.INFO: 0,
+    ValidationSeverity.WARNING: 1,
+    ValidationSeverity.ERROR: 2,
+    ValidationSeverity.CRITICAL: 3
+}
+
+# Severities that count a check as passed or failed
+_PASSING_SEVERITIES = frozenset({ValidationSeverity.INFO})
+_FAILING_SEVERITIES = frozenset({ValidationSeverity.CRITICAL, ValidationSeverity.ERROR})
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a validation check."""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -41,22 +81,23 @@ class ValidationResult:
     field_path: Optional[str] = None
     value: Optional[Any] = None
     expected_value: Optional[Any] = None
-    suggestions: List[str] = field(default_factory=list)
+    # Shared empty tuple by default; most results carry no suggestions
+    suggestions: Sequence[str] = ()
     metadata: Dict[str, Any] = field(default_factory=dict)
     timestamp: datetime = field(default_factory=datetime.utcnow)
     
     @property
     def is_passing(self) -> bool:
         """Check if this validation result indicates a passing check."""
-        return self.severity in [ValidationSeverity.INFO]
+        return self.severity in _PASSING_SEVERITIES
     
     @property
     def is_failing(self) -> bool:
         """Check if this validation result indicates a failing check."""
-        return self.severity in [ValidationSeverity.CRITICAL, ValidationSeverity.ERROR]
+        return self.severity in _FAILING_SEVERITIES
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationSummary:
     """Summary of validation results."""
     total_checks: int = 0
@@ -68,6 +109,21 @@ class ValidationSummary:
     compliance_score: float = 0.0
     overall_status: str = "unknown"
     
+    @classmethod
+    def from_results(cls, results: List[ValidationResult]) -> "ValidationSummary":
+        """Tally check counters from results in a single counting pass."""
+        counts = Counter(result.severity for result in results)
+        errors = counts[ValidationSeverity.ERROR]
+        critical_issues = counts[ValidationSeverity.CRITICAL]
+        return cls(
+            total_checks=len(results),
+            passed_checks=counts[ValidationSeverity.INFO],
+            failed_checks=errors + critical_issues,
+            warnings=counts[ValidationSeverity.WARNING],
+            critical_issues=critical_issues,
+            errors=errors
+        )
+    
     @property
     def pass_rate(self) -> float:
         """Calculate the pass rate as a percentage."""
@@ -76,7 +132,7 @@ class ValidationSummary:
         return (self.passed_checks / self.total_checks) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationContext:
     """Context information for validation."""
     object_type: str
@@ -89,6 +145,9 @@ class ValidationContext:
     custom_rules: List[str] = field(default_factory=list)
     excluded_rules: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Stop a validator at the first result at or above stop_on (CRITICAL if unset)
+    fail_fast: bool = False
+    stop_on: Optional[ValidationSeverity] = None
 
 
 class BaseValidator(ABC):
@@ -98,6 +157,8 @@ class BaseValidator(ABC):
         self.name = name or self.__class__.__name__
         self.enabled_rules: Dict[str, bool] = {}
         self.rule_configurations: Dict[str, Dict[str, Any]] = {}
+        # Kept in step with enabled_rules so rule checks are one set lookup
+        self._disabled_rules: FrozenSet[str] = frozenset()
         
     @abstractmethod
     def validate(self, data: Any, context: ValidationContext) -> List[ValidationResult]:
@@ -113,6 +174,28 @@ class BaseValidator(ABC):
         """
         pass
     
+    def iter_validate(self, data: Any, context: ValidationContext) -> Iterator[ValidationResult]:
+        """
+        Yield validation results one at a time.
+        
+        The default delegates to validate(); validators that produce results
+        lazily override this so fail-fast runs skip the remaining rules.
+        """
+        yield from self.validate(data, context)
+    
+    def run(self, data: Any, context: ValidationContext) -> List[ValidationResult]:
+        """Validate, honouring the context's fail-fast settings."""
+        if not context.fail_fast:
+            return self.validate(data, context)
+        
+        threshold = SEVERITY_RANK[context.stop_on or ValidationSeverity.CRITICAL]
+        results = []
+        for result in self.iter_validate(data, context):
+            results.append(result)
+            if SEVERITY_RANK.get(result.severity, 0) >= threshold:
+                break
+        return results
+    
     @abstractmethod
     def get_supported_rules(self) -> List[str]:
         """Get list of supported validation rules."""
@@ -125,14 +208,18 @@ class BaseValidator(ABC):
     def enable_rule(self, rule_id: str) -> None:
         """Enable a specific validation rule."""
         self.enabled_rules[rule_id] = True
+        if rule_id in self._disabled_rules:
+            self._disabled_rules = self._disabled_rules - {rule_id}
     
     def disable_rule(self, rule_id: str) -> None:
         """Disable a specific validation rule."""
         self.enabled_rules[rule_id] = False
+        if rule_id not in self._disabled_rules:
+            self._disabled_rules = self._disabled_rules | {rule_id}
     
     def is_rule_enabled(self, rule_id: str) -> bool:
         """Check if a rule is enabled."""
-        return self.enabled_rules.get(rule_id, True)
+        return rule_id not in self._disabled_rules
     
     def create_result(
         self,
@@ -145,7 +232,7 @@ class BaseValidator(ABC):
         field_path: str = None,
         value: Any = None,
         expected_value: Any = None,
-        suggestions: List[str] = None,
+        suggestions: Sequence[str] = None,
         metadata: Dict[str, Any] = None
     ) -> ValidationResult:
         """Helper method to create validation results."""
@@ -159,7 +246,7 @@ class BaseValidator(ABC):
             field_path=field_path,
             value=value,
             expected_value=expected_value,
-            suggestions=suggestions or [],
+            suggestions=suggestions or (),
             metadata=metadata or {}
         )
     
@@ -172,19 +259,45 @@ class BaseValidator(ABC):
         category: ValidationCategory = ValidationCategory.DATA_INTEGRITY
     ) -> Optional[ValidationResult]:
         """Validate that a required field is present and not empty."""
-        if field_name not in data or data[field_name] is None or data[field_name] == "":
-            return self.create_result(
-                rule_id=rule_id,
-                rule_name=rule_name,
-                category=category,
-                severity=ValidationSeverity.ERROR,
-                message=f"Required field '{field_name}' is missing or empty",
-                field_path=field_name,
-                value=data.get(field_name),
-                suggestions=[f"Provide a value for {field_name}"]
-            )
+        value = data.get(field_name)
+        if value is None or value == "":
+            return self._missing_field_result(field_name, value, rule_id, rule_name, category)
         return None
     
+    def validate_required_fields(
+        self,
+        data: Dict[str, Any],
+        field_names: Iterable[str],
+        rule_id: str,
+        rule_name: str,
+        category: ValidationCategory = ValidationCategory.DATA_INTEGRITY
+    ) -> Iterator[ValidationResult]:
+        """Validate several required fields in one pass, yielding a result per failure."""
+        for field_name in field_names:
+            value = data.get(field_name)
+            if value is None or value == "":
+                yield self._missing_field_result(field_name, value, rule_id, rule_name, category)
+    
+    def _missing_field_result(
+        self,
+        field_name: str,
+        value: Any,
+        rule_id: str,
+        rule_name: str,
+        category: ValidationCategory
+    ) -> ValidationResult:
+        """Result for a required field that is missing or empty."""
+        return self.create_result(
+            rule_id=rule_id,
+            rule_name=rule_name,
+            category=category,
+            severity=ValidationSeverity.ERROR,
+            message=_field_message(_REQUIRED_MSG, field_name),
+            field_path=field_name,
+            value=value,
+            suggestions=[_field_message(_REQUIRED_SUGGESTION, field_name)]
+        )
+    
     def validate_field_type(
         self,
         data: Dict[str, Any],
@@ -195,20 +308,21 @@ class BaseValidator(ABC):
         category: ValidationCategory = ValidationCategory.DATA_INTEGRITY
     ) -> Optional[ValidationResult]:
         """Validate that a field has the expected type."""
-        if field_name in data and data[field_name] is not None:
-            if not isinstance(data[field_name], expected_type):
-                return self.create_result(
-                    rule_id=rule_id,
-                    rule_name=rule_name,
-                    category=category,
-                    severity=ValidationSeverity.ERROR,
-                    message=f"Field '{field_name}' has incorrect type",
-                    description=f"Expected {expected_type.__name__}, got {type(data[field_name]).__name__}",
-                    field_path=field_name,
-                    value=data[field_name],
-                    expected_value=f"Value of type {expected_type.__name__}",
-                    suggestions=[f"Convert {field_name} to {expected_type.__name__}"]
-                )
+        value = data.get(field_name)
+        if value is not None and not isinstance(value, expected_type):
+            expected_name = expected_type.__name__
+            return self.create_result(
+                rule_id=rule_id,
+                rule_name=rule_name,
+                category=category,
+                severity=ValidationSeverity.ERROR,
+                message=_field_message(_TYPE_MSG, field_name),
+                description=_field_message(_TYPE_DESCRIPTION, expected_name, type(value).__name__),
+                field_path=field_name,
+                value=value,
+                expected_value=_field_message(_TYPE_EXPECTED, expected_name),
+                suggestions=[_field_message(_TYPE_SUGGESTION, field_name, expected_name)]
+            )
         return None
     
     def validate_field_range(
@@ -222,31 +336,30 @@ class BaseValidator(ABC):
         category: ValidationCategory = ValidationCategory.DATA_INTEGRITY
     ) -> Optional[ValidationResult]:
         """Validate that a numeric field is within the specified range."""
-        if field_name in data and data[field_name] is not None:
-            value = data[field_name]
-            if isinstance(value, (int, float)):
-                if min_value is not None and value < min_value:
-                    return self.create_result(
-                        rule_id=rule_id,
-                        rule_name=rule_name,
-                        category=category,
-                        severity=ValidationSeverity.ERROR,
-                        message=f"Field '{field_name}' value {value} is below minimum {min_value}",
-                        field_path=field_name,
-                        value=value,
-                        expected_value=f"Value >= {min_value}",
-                        suggestions=[f"Increase {field_name} to at least {min_value}"]
-                    )
-                if max_value is not None and value > max_value:
-                    return self.create_result(
-                        rule_id=rule_id,
-                        rule_name=rule_name,
-                        category=category,
-                        severity=ValidationSeverity.ERROR,
-                        message=f"Field '{field_name}' value {value} exceeds maximum {max_value}",
-                        field_path=field_name,
-                        value=value,
-                        expected_value=f"Value <= {max_value}",
-                        suggestions=[f"Reduce {field_name} to at most {max_value}"]
-                    )
-        return None
\ No newline at end of file
+        value = data.get(field_name)
+        if value is None:
+            return None
+        # Exact-type lookup covers plain ints/floats; isinstance catches subclasses
+        if type(value) not in _NUMERIC_TYPE_SET and not isinstance(value, _NUMERIC_TYPES):
+            return None
+        
+        if min_value is not None and value < min_value:
+            message, expected, suggestion = _BELOW_MIN_MSG, _BELOW_MIN_EXPECTED, _BELOW_MIN_SUGGESTION
+            bound = min_value
+        elif max_value is not None and value > max_value:
+            message, expected, suggestion = _ABOVE_MAX_MSG, _ABOVE_MAX_EXPECTED, _ABOVE_MAX_SUGGESTION
+            bound = max_value
+        else:
+            return None
+        
+        return self.create_result(
+            rule_id=rule_id,
+            rule_name=rule_name,
+            category=category,
+            severity=ValidationSeverity.ERROR,
+            message=message.format(field_name, value, bound),
+            field_path=field_name,
+            value=value,
+            expected_value=expected.format(bound),
+            suggestions=[suggestion.format(field_name, bound)]
+        )
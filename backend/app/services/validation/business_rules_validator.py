@@ -2,9 +2,10 @@
 Business rules and logic validator.
 """
 
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from datetime import datetime, date
 from collections import defaultdict
+from types import MappingProxyType
 import re
 from .base_validator import (
     BaseValidator, ValidationResult, ValidationSeverity, 
@@ -12,58 +13,133 @@ from .base_validator import (
 )
 
 
+# Keyword groups scanned by the business rules (matched as lowercase substrings)
+_EFFICACY_PURPOSE_TERMS = ("efficacy", "primary", "secondary")
+_ENDPOINT_TIMING_TERMS = ("week", "day", "month", "baseline", "endpoint", "time")
+_POWER_TERMS = ("power", "sample size", "alpha", "beta", "effect size")
+_SAMPLE_SIZE_TERMS = ("power", "sample size", "n=", "subjects", "patients")
+_INTERIM_TERMS = ("interim", "futility", "early stopping")
+_INTERIM_TIMING_TERMS = ("week", "month", "patient", "event", "interim")
+_STATISTICAL_TEST_TERMS = ("test", "pvalue", "significance")
+_BLINDING_TERMS = ("blind", "masked", "placebo")
+_TIME_TO_EVENT_TERMS = ("time", "survival", "tte")
+_CONTINUOUS_TERMS = ("continuous", "mean", "change")
+_BINARY_TERMS = ("proportion", "rate", "binary")
+_CATEGORICAL_TERMS = ("categorical", "category")
+
+# Analysis set id fragments (matched against the uppercased id)
+_EFFICACY_POPULATIONS = ("ITT", "FAS")
+_SAFETY_POPULATIONS = ("SAF", "SAFETY")
+
+_LOCKED_STATUSES = frozenset({"final", "locked", "submitted"})
+
+# Reference document types required for a regulatory submission
+_SUBMISSION_DOCUMENTS = MappingProxyType({
+    "protocol": "Study protocol",
+    "sap": "Statistical Analysis Plan",
+    "csr": "Clinical Study Report sections"
+})
+
+_BUSINESS_RULES = MappingProxyType({
+    "br_001": "Analysis workflow sequence validation",
+    "br_002": "Statistical method appropriateness",
+    "br_003": "Population subset consistency",
+    "br_004": "Output type compatibility",
+    "br_005": "Timeline and milestone validation",
+    "br_006": "Resource allocation validation",
+    "br_007": "Dependency resolution",
+    "br_008": "Authorization and permissions",
+    "br_009": "Version compatibility",
+    "br_010": "Study phase appropriateness",
+    "br_011": "Endpoint type validation",
+    "br_012": "Sample size considerations",
+    "br_013": "Protocol deviation handling",
+    "br_014": "Quality control thresholds",
+    "br_015": "Regulatory submission readiness",
+    "br_016": "Data lock validation",
+    "br_017": "Blinding integrity",
+    "br_018": "Interim analysis timing",
+    "br_019": "Safety signal detection",
+    "br_020": "Efficacy boundary validation"
+})
+
+# Business domain knowledge
+_STUDY_PHASES = ("Phase I", "Phase II", "Phase III", "Phase IV", "Pre-Clinical")
+_ENDPOINT_TYPES = ("Primary", "Secondary", "Exploratory", "Safety", "Pharmacokinetic")
+_ANALYSIS_TIMING = ("Pre-specified", "Ad-hoc", "Post-hoc", "Interim")
+
+# Statistical method compatibility matrix
+_METHOD_DATA_TYPE_COMPATIBILITY = MappingProxyType({
+    method: frozenset(data_types) for method, data_types in {
+        "descriptive": ("continuous", "categorical", "ordinal", "binary"),
+        "t_test": ("continuous",),
+        "chi_square": ("categorical", "binary"),
+        "anova": ("continuous",),
+        "logistic_regression": ("binary", "categorical"),
+        "survival_analysis": ("time_to_event",),
+        "mixed_model": ("continuous", "longitudinal")
+    }.items()
+})
+
+# Population subset rules
+_VALID_POPULATION_SUBSETS = MappingProxyType({
+    "ITT": "Intent-to-treat population",
+    "PP": "Per-protocol population", 
+    "FAS": "Full analysis set",
+    "SAF": "Safety analysis set",
+    "mITT": "Modified intent-to-treat",
+    "MITT": "Modified intent-to-treat"
+})
+
+
+def _contains_any(text: str, terms: Tuple[str, ...]) -> bool:
+    """Check whether any of the terms occurs in text."""
+    # map() keeps the scan in C instead of resuming a generator per term
+    return any(map(text.__contains__, terms))
+
+
 class BusinessRulesValidator(BaseValidator):
     """Validator for business logic and domain-specific rules."""
     
     def __init__(self):
         super().__init__("Business Rules Validator")
-        self.business_rules = {
-            "br_001": "Analysis workflow sequence validation",
-            "br_002": "Statistical method appropriateness",
-            "br_003": "Population subset consistency",
-            "br_004": "Output type compatibility",
-            "br_005": "Timeline and milestone validation",
-            "br_006": "Resource allocation validation",
-            "br_007": "Dependency resolution",
-            "br_008": "Authorization and permissions",
-            "br_009": "Version compatibility",
-            "br_010": "Study phase appropriateness",
-            "br_011": "Endpoint type validation",
-            "br_012": "Sample size considerations",
-            "br_013": "Protocol deviation handling",
-            "br_014": "Quality control thresholds",
-            "br_015": "Regulatory submission readiness",
-            "br_016": "Data lock validation",
-            "br_017": "Blinding integrity",
-            "br_018": "Interim analysis timing",
-            "br_019": "Safety signal detection",
-            "br_020": "Efficacy boundary validation"
-        }
+        # Shared, read-only rule and domain tables
+        self.business_rules = _BUSINESS_RULES
         
         # Business domain knowledge
-        self.study_phases = ["Phase I", "Phase II", "Phase III", "Phase IV", "Pre-Clinical"]
-        self.endpoint_types = ["Primary", "Secondary", "Exploratory", "Safety", "Pharmacokinetic"]
-        self.analysis_timing = ["Pre-specified", "Ad-hoc", "Post-hoc", "Interim"]
+        self.study_phases = _STUDY_PHASES
+        self.endpoint_types = _ENDPOINT_TYPES
+        self.analysis_timing = _ANALYSIS_TIMING
         
         # Statistical method compatibility matrix
-        self.method_data_type_compatibility = {
-            "descriptive": ["continuous", "categorical", "ordinal", "binary"],
-            "t_test": ["continuous"],
-            "chi_square": ["categorical", "binary"],
-            "anova": ["continuous"],
-            "logistic_regression": ["binary", "categorical"],
-            "survival_analysis": ["time_to_event"],
-            "mixed_model": ["continuous", "longitudinal"]
-        }
+        self.method_data_type_compatibility = _METHOD_DATA_TYPE_COMPATIBILITY
         
         # Population subset rules
-        self.valid_population_subsets = {
-            "ITT": "Intent-to-treat population",
-            "PP": "Per-protocol population", 
-            "FAS": "Full analysis set",
-            "SAF": "Safety analysis set",
-            "mITT": "Modified intent-to-treat",
-            "MITT": "Modified intent-to-treat"
+        self.valid_population_subsets = _VALID_POPULATION_SUBSETS
+        
+        # Rules applied to each object type, in evaluation order
+        self._rules_by_object_type = {
+            "reporting_event": (
+                ("br_001", self._validate_analysis_workflow),
+                ("br_015", self._validate_submission_readiness),
+                ("br_016", self._validate_data_lock_status),
+                ("br_009", self._validate_version_compatibility)
+            ),
+            "analysis": (
+                ("br_002", self._validate_statistical_method_appropriateness),
+                ("br_003", self._validate_population_subset_consistency),
+                ("br_011", self._validate_endpoint_type),
+                ("br_012", self._validate_sample_size_considerations),
+                ("br_018", self._validate_interim_analysis_timing)
+            ),
+            "method": (
+                ("br_007", self._validate_method_dependencies),
+                ("br_014", self._validate_quality_control_thresholds)
+            ),
+            "study": (
+                ("br_010", self._validate_study_phase_appropriateness),
+                ("br_017", self._validate_blinding_integrity)
+            )
         }
     
     def get_supported_rules(self) -> List[str]:
@@ -87,90 +163,10 @@ class BusinessRulesValidator(BaseValidator):
             return results
         
         # Apply business rules based on object type
-        if context.object_type == "reporting_event":
-            results.extend(self._validate_reporting_event_business_rules(data, context))
-        elif context.object_type == "analysis":
-            results.extend(self._validate_analysis_business_rules(data, context))
-        elif context.object_type == "method":
-            results.extend(self._validate_method_business_rules(data, context))
-        elif context.object_type == "study":
-            results.extend(self._validate_study_business_rules(data, context))
-        
-        return results
-    
-    def _validate_reporting_event_business_rules(self, data: Dict[str, Any], context: ValidationContext) -> List[ValidationResult]:
-        """Validate business rules for reporting events."""
-        results = []
-        
-        # Rule BR_001: Analysis workflow sequence validation
-        if self.is_rule_enabled("br_001"):
-            results.extend(self._validate_analysis_workflow(data))
-        
-        # Rule BR_015: Regulatory submission readiness
-        if self.is_rule_enabled("br_015"):
-            results.extend(self._validate_submission_readiness(data))
-        
-        # Rule BR_016: Data lock validation
-        if self.is_rule_enabled("br_016"):
-            results.extend(self._validate_data_lock_status(data))
-        
-        # Rule BR_009: Version compatibility
-        if self.is_rule_enabled("br_009"):
-            results.extend(self._validate_version_compatibility(data))
-        
-        return results
-    
-    def _validate_analysis_business_rules(self, data: Dict[str, Any], context: ValidationContext) -> List[ValidationResult]:
-        """Validate business rules for analyses."""
-        results = []
-        
-        # Rule BR_002: Statistical method appropriateness
-        if self.is_rule_enabled("br_002"):
-            results.extend(self._validate_statistical_method_appropriateness(data))
-        
-        # Rule BR_003: Population subset consistency
-        if self.is_rule_enabled("br_003"):
-            results.extend(self._validate_population_subset_consistency(data))
-        
-        # Rule BR_011: Endpoint type validation
-        if self.is_rule_enabled("br_011"):
-            results.extend(self._validate_endpoint_type(data))
-        
-        # Rule BR_012: Sample size considerations
-        if self.is_rule_enabled("br_012"):
-            results.extend(self._validate_sample_size_considerations(data))
-        
-        # Rule BR_018: Interim analysis timing
-        if self.is_rule_enabled("br_018"):
-            results.extend(self._validate_interim_analysis_timing(data))
-        
-        return results
-    
-    def _validate_method_business_rules(self, data: Dict[str, Any], context: ValidationContext) -> List[ValidationResult]:
-        """Validate business rules for methods."""
-        results = []
-        
-        # Rule BR_007: Dependency resolution
-        if self.is_rule_enabled("br_007"):
-            results.extend(self._validate_method_dependencies(data))
-        
-        # Rule BR_014: Quality control thresholds
-        if self.is_rule_enabled("br_014"):
-            results.extend(self._validate_quality_control_thresholds(data))
-        
-        return results
-    
-    def _validate_study_business_rules(self, data: Dict[str, Any], context: ValidationContext) -> List[ValidationResult]:
-        """Validate business rules for studies."""
-        results = []
-        
-        # Rule BR_010: Study phase appropriateness
-        if self.is_rule_enabled("br_010"):
-            results.extend(self._validate_study_phase_appropriateness(data))
-        
-        # Rule BR_017: Blinding integrity
-        if self.is_rule_enabled("br_017"):
-            results.extend(self._validate_blinding_integrity(data))
+        disabled_rules = self._disabled_rules
+        for rule_id, check in self._rules_by_object_type.get(context.object_type, ()):
+            if rule_id not in disabled_rules:
+                results.extend(check(data))
         
         return results
     
@@ -181,19 +177,28 @@ class BusinessRulesValidator(BaseValidator):
         if "analyses" in data:
             analyses = data["analyses"]
             
-            # Check for logical sequence
+            # Classify every analysis in one pass: ordering of primary/secondary
+            # purposes, and whether safety and efficacy analyses are present
             primary_found = False
             secondary_before_primary = False
+            has_safety = False
+            has_efficacy = False
             
-            for i, analysis in enumerate(analyses):
+            for analysis in analyses:
                 if isinstance(analysis, dict):
-                    purpose = self._extract_purpose(analysis)
+                    purpose = self._extract_purpose_lower(analysis)
                     
-                    if "primary" in purpose.lower():
+                    if "primary" in purpose:
                         primary_found = True
-                    elif "secondary" in purpose.lower() and not primary_found:
+                    elif "secondary" in purpose and not primary_found:
                         secondary_before_primary = True
+                    
+                    if "safety" in purpose:
+                        has_safety = True
+                    elif _contains_any(purpose, _EFFICACY_PURPOSE_TERMS):
+                        has_efficacy = True
             
+            # Check for logical sequence
             if secondary_before_primary:
                 results.append(self.create_result(
                     rule_id="br_001",
@@ -208,20 +213,8 @@ class BusinessRulesValidator(BaseValidator):
                     ]
                 ))
             
-            # Check for prerequisite analyses
-            safety_analyses = []
-            efficacy_analyses = []
-            
-            for analysis in analyses:
-                if isinstance(analysis, dict):
-                    purpose = self._extract_purpose(analysis)
-                    if "safety" in purpose.lower():
-                        safety_analyses.append(analysis)
-                    elif any(term in purpose.lower() for term in ["efficacy", "primary", "secondary"]):
-                        efficacy_analyses.append(analysis)
-            
             # For efficacy studies, safety analyses should be present
-            if efficacy_analyses and not safety_analyses:
+            if has_efficacy and not has_safety:
                 results.append(self.create_result(
                     rule_id="br_001",
                     rule_name=self.business_rules["br_001"],
@@ -247,7 +240,7 @@ class BusinessRulesValidator(BaseValidator):
         # Check method compatibility
         if method_id and data_type:
             method_name = self._extract_method_name(method_id)
-            compatible_types = self.method_data_type_compatibility.get(method_name, [])
+            compatible_types = self.method_data_type_compatibility.get(method_name, frozenset())
             
             if compatible_types and data_type not in compatible_types:
                 results.append(self.create_result(
@@ -266,7 +259,8 @@ class BusinessRulesValidator(BaseValidator):
                 ))
         
         # Check sample size requirements for specific methods
-        if "t_test" in method_id.lower() or "anova" in method_id.lower():
+        method_id_lower = method_id.lower()
+        if "t_test" in method_id_lower or "anova" in method_id_lower:
             # These methods have sample size assumptions
             if not self._has_adequate_sample_size_documentation(data):
                 results.append(self.create_result(
@@ -290,13 +284,15 @@ class BusinessRulesValidator(BaseValidator):
         results = []
         
         analysis_set_id = data.get("analysisSetId", "")
-        purpose = self._extract_purpose(data)
+        purpose = self._extract_purpose_lower(data)
         
         if analysis_set_id and purpose:
+            analysis_set_id_upper = analysis_set_id.upper()
+            
             # Business rules for population selection
-            if "primary" in purpose.lower():
+            if "primary" in purpose:
                 # Primary efficacy should use ITT/FAS
-                if not any(pop in analysis_set_id.upper() for pop in ["ITT", "FAS"]):
+                if not _contains_any(analysis_set_id_upper, _EFFICACY_POPULATIONS):
                     results.append(self.create_result(
                         rule_id="br_003",
                         rule_name=self.business_rules["br_003"],
@@ -312,9 +308,9 @@ class BusinessRulesValidator(BaseValidator):
                         ]
                     ))
             
-            elif "safety" in purpose.lower():
+            elif "safety" in purpose:
                 # Safety analyses should use safety population
-                if not any(pop in analysis_set_id.upper() for pop in ["SAF", "SAFETY"]):
+                if not _contains_any(analysis_set_id_upper, _SAFETY_POPULATIONS):
                     results.append(self.create_result(
                         rule_id="br_003",
                         rule_name=self.business_rules["br_003"],
@@ -330,9 +326,9 @@ class BusinessRulesValidator(BaseValidator):
                         ]
                     ))
             
-            elif "per.protocol" in purpose.lower() or "pp" in purpose.lower():
+            elif "per.protocol" in purpose or "pp" in purpose:
                 # Per-protocol analyses
-                if "PP" not in analysis_set_id.upper():
+                if "PP" not in analysis_set_id_upper:
                     results.append(self.create_result(
                         rule_id="br_003",
                         rule_name=self.business_rules["br_003"],
@@ -351,10 +347,10 @@ class BusinessRulesValidator(BaseValidator):
         """Validate endpoint type appropriateness."""
         results = []
         
-        purpose = self._extract_purpose(data)
+        purpose = self._extract_purpose_lower(data)
         
         # Check endpoint type consistency
-        if "primary" in purpose.lower():
+        if "primary" in purpose:
             # Primary endpoints should have specific characteristics
             if "description" in data:
                 description = data["description"].lower()
@@ -377,8 +373,7 @@ class BusinessRulesValidator(BaseValidator):
                     ))
                 
                 # Should mention measurement timing
-                timing_keywords = ["week", "day", "month", "baseline", "endpoint", "time"]
-                if not any(keyword in description for keyword in timing_keywords):
+                if not _contains_any(description, _ENDPOINT_TIMING_TERMS):
                     results.append(self.create_result(
                         rule_id="br_011",
                         rule_name=self.business_rules["br_011"],
@@ -395,17 +390,16 @@ class BusinessRulesValidator(BaseValidator):
         """Validate sample size considerations."""
         results = []
         
-        purpose = self._extract_purpose(data)
+        purpose = self._extract_purpose_lower(data)
         
         # Primary efficacy analyses need power considerations
-        if "primary" in purpose.lower() and "efficacy" in purpose.lower():
+        if "primary" in purpose and "efficacy" in purpose:
             
             # Look for power/sample size documentation
             has_power_docs = False
             if "description" in data:
                 desc = data["description"].lower()
-                power_keywords = ["power", "sample size", "alpha", "beta", "effect size"]
-                has_power_docs = any(keyword in desc for keyword in power_keywords)
+                has_power_docs = _contains_any(desc, _POWER_TERMS)
             
             if not has_power_docs:
                 results.append(self.create_result(
@@ -431,9 +425,9 @@ class BusinessRulesValidator(BaseValidator):
         analysis_name = data.get("name", "").lower()
         description = data.get("description", "").lower()
         
-        # Check if this is an interim analysis
-        is_interim = any(term in text for text in [analysis_name, description] 
-                        for term in ["interim", "futility", "early stopping"])
+        # Check if this is an interim analysis; the newline keeps a term from
+        # matching across the end of the name and the start of the description
+        is_interim = _contains_any(f"{analysis_name}\n{description}", _INTERIM_TERMS)
         
         if is_interim:
             # Interim analyses need special considerations
@@ -453,8 +447,7 @@ class BusinessRulesValidator(BaseValidator):
                 ))
             
             # Should have timing specification
-            timing_specified = any(term in description for term in 
-                                 ["week", "month", "patient", "event", "interim"])
+            timing_specified = _contains_any(description, _INTERIM_TIMING_TERMS)
             if not timing_specified:
                 results.append(self.create_result(
                     rule_id="br_018",
@@ -472,21 +465,21 @@ class BusinessRulesValidator(BaseValidator):
         """Validate regulatory submission readiness."""
         results = []
         
-        # Check for required documentation
-        required_elements = [
-            ("protocol", "Study protocol"),
-            ("sap", "Statistical Analysis Plan"),
-            ("csr", "Clinical Study Report sections")
+        # Check for required documentation, stopping once every type is found
+        found_types = set()
+        for doc in data.get("referenceDocuments", []):
+            if isinstance(doc, dict):
+                doc_type = doc.get("type", "").lower()
+                if doc_type in _SUBMISSION_DOCUMENTS:
+                    found_types.add(doc_type)
+                    if len(found_types) == len(_SUBMISSION_DOCUMENTS):
+                        break
+        
+        missing_docs = [
+            description for doc_type, description in _SUBMISSION_DOCUMENTS.items()
+            if doc_type not in found_types
         ]
         
-        ref_docs = data.get("referenceDocuments", [])
-        doc_types = {doc.get("type", "").lower() for doc in ref_docs if isinstance(doc, dict)}
-        
-        missing_docs = []
-        for doc_type, description in required_elements:
-            if doc_type not in doc_types:
-                missing_docs.append(description)
-        
         if missing_docs:
             results.append(self.create_result(
                 rule_id="br_015",
@@ -507,7 +500,7 @@ class BusinessRulesValidator(BaseValidator):
         # Check if data lock status is documented
         if "dataLock" not in data and "status" in data:
             status = data["status"].lower()
-            if status in ["final", "locked", "submitted"]:
+            if status in _LOCKED_STATUSES:
                 results.append(self.create_result(
                     rule_id="br_016",
                     rule_name=self.business_rules["br_016"],
@@ -560,7 +553,8 @@ class BusinessRulesValidator(BaseValidator):
                         result_pattern = operation["resultPattern"]
                         
                         # Operations that reference previous results
-                        if "previous" in str(result_pattern).lower() or "prior" in str(result_pattern).lower():
+                        result_pattern_lower = str(result_pattern).lower()
+                        if "previous" in result_pattern_lower or "prior" in result_pattern_lower:
                             if i == 0:
                                 results.append(self.create_result(
                                     rule_id="br_007",
@@ -585,7 +579,7 @@ class BusinessRulesValidator(BaseValidator):
                     op_name = operation["name"].lower()
                     
                     # Statistical tests should have significance levels
-                    if any(term in op_name for term in ["test", "pvalue", "significance"]):
+                    if _contains_any(op_name, _STATISTICAL_TEST_TERMS):
                         if "parameters" not in operation:
                             results.append(self.create_result(
                                 rule_id="br_014",
@@ -610,12 +604,15 @@ class BusinessRulesValidator(BaseValidator):
             if phase == "Phase I":
                 # Phase I focuses on safety and dose-finding
                 if "analyses" in data:
-                    safety_analyses = [a for a in data["analyses"] 
-                                     if isinstance(a, dict) and "safety" in self._extract_purpose(a).lower()]
-                    efficacy_analyses = [a for a in data["analyses"] 
-                                       if isinstance(a, dict) and "efficacy" in self._extract_purpose(a).lower()]
+                    safety_count = 0
+                    efficacy_count = 0
+                    for analysis in data["analyses"]:
+                        if isinstance(analysis, dict):
+                            purpose = self._extract_purpose_lower(analysis)
+                            safety_count += "safety" in purpose
+                            efficacy_count += "efficacy" in purpose
                     
-                    if len(efficacy_analyses) > len(safety_analyses):
+                    if efficacy_count > safety_count:
                         results.append(self.create_result(
                             rule_id="br_010",
                             rule_name=self.business_rules["br_010"],
@@ -629,10 +626,13 @@ class BusinessRulesValidator(BaseValidator):
             elif phase == "Phase III":
                 # Phase III should have primary efficacy endpoints
                 if "analyses" in data:
-                    primary_efficacy = any(
-                        "primary" in self._extract_purpose(a).lower() and "efficacy" in self._extract_purpose(a).lower()
-                        for a in data["analyses"] if isinstance(a, dict)
-                    )
+                    primary_efficacy = False
+                    for analysis in data["analyses"]:
+                        if isinstance(analysis, dict):
+                            purpose = self._extract_purpose_lower(analysis)
+                            if "primary" in purpose and "efficacy" in purpose:
+                                primary_efficacy = True
+                                break
                     
                     if not primary_efficacy:
                         results.append(self.create_result(
@@ -653,7 +653,7 @@ class BusinessRulesValidator(BaseValidator):
         
         # Check if study involves blinding
         study_design = data.get("design", "").lower()
-        is_blinded = any(term in study_design for term in ["blind", "masked", "placebo"])
+        is_blinded = _contains_any(study_design, _BLINDING_TERMS)
         
         if is_blinded:
             # Blinded studies need special handling
@@ -687,6 +687,10 @@ class BusinessRulesValidator(BaseValidator):
             return purpose.get("controlledTerm", "") or purpose.get("sponsorTerm", "")
         return str(purpose)
     
+    def _extract_purpose_lower(self, analysis: Dict[str, Any]) -> str:
+        """Extract the purpose string lowercased, for keyword checks."""
+        return self._extract_purpose(analysis).lower()
+    
     def _extract_method_name(self, method_id: str) -> str:
         """Extract method name from method ID."""
         # Simple heuristic to extract method type from ID
@@ -699,16 +703,15 @@ class BusinessRulesValidator(BaseValidator):
     def _infer_data_type(self, analysis: Dict[str, Any]) -> str:
         """Infer data type from analysis context."""
         # This is a simplified inference - real implementation would be more sophisticated
-        name = analysis.get("name", "").lower()
-        description = analysis.get("description", "").lower()
+        text = analysis.get("name", "").lower() + analysis.get("description", "").lower()
         
-        if any(term in name + description for term in ["time", "survival", "tte"]):
+        if _contains_any(text, _TIME_TO_EVENT_TERMS):
             return "time_to_event"
-        elif any(term in name + description for term in ["continuous", "mean", "change"]):
+        elif _contains_any(text, _CONTINUOUS_TERMS):
             return "continuous"
-        elif any(term in name + description for term in ["proportion", "rate", "binary"]):
+        elif _contains_any(text, _BINARY_TERMS):
             return "binary"
-        elif any(term in name + description for term in ["categorical", "category"]):
+        elif _contains_any(text, _CATEGORICAL_TERMS):
             return "categorical"
         
         return "unknown"
@@ -716,5 +719,4 @@ class BusinessRulesValidator(BaseValidator):
     def _has_adequate_sample_size_documentation(self, analysis: Dict[str, Any]) -> bool:
         """Check if sample size is adequately documented."""
         description = analysis.get("description", "").lower()
-        power_terms = ["power", "sample size", "n=", "subjects", "patients"]
-        return any(term in description for term in power_terms)
\ No newline at end of file
+        return _contains_any(description, _SAMPLE_SIZE_TERMS)
\ No newline at end of file
@@ -4,13 +4,13 @@ Main validation orchestrator engine.
 
 from typing import Any, Dict, List, Optional, Set, Type
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 import logging
 from datetime import datetime
 
 from .base_validator import (
     BaseValidator, ValidationResult, ValidationSeverity, 
-    ValidationCategory, ValidationContext, ValidationSummary
+    ValidationCategory, ValidationContext, ValidationSummary, SEVERITY_RANK
 )
 from .ars_validator import ARSValidator
 from .cdisc_validator import CDISCValidator
@@ -19,6 +19,11 @@ from .data_integrity_validator import DataIntegrityValidator
 from .business_rules_validator import BusinessRulesValidator
 
 
+# Plain string values of the enums, looked up instead of reading .value per result
+_SEVERITY_VALUES = {severity: severity.value for severity in ValidationSeverity}
+_CATEGORY_VALUES = {category: category.value for category in ValidationCategory}
+
+
 @dataclass
 class ValidationProfile:
     """Configuration profile for validation."""
@@ -111,6 +116,10 @@ class ValidationEngine:
         if not profile:
             raise ValueError(f"Unknown validation profile: {profile_name}")
         
+        # Fail-fast profiles also stop each validator at its first critical result
+        if profile.fail_fast and not context.fail_fast:
+            context = replace(context, fail_fast=True)
+        
         self.logger.info(f"Starting validation with profile '{profile_name}' for {context.object_type}")
         
         # Prepare validators
@@ -135,9 +144,10 @@ class ValidationEngine:
             )
         
         # Filter results by severity threshold
+        threshold = self._severity_level(profile.severity_threshold)
         filtered_results = [
             result for result in all_results
-            if self._severity_level(result.severity) >= self._severity_level(profile.severity_threshold)
+            if SEVERITY_RANK.get(result.severity, -1) >= threshold
         ]
         
         # Generate summary
@@ -392,7 +402,7 @@ class ValidationEngine:
     def _safe_validate(self, validator: BaseValidator, data: Any, context: ValidationContext) -> List[ValidationResult]:
         """Safely execute validator with error handling."""
         try:
-            return validator.validate(data, context)
+            return validator.run(data, context)
         except Exception as e:
             self.logger.error(f"Validation error in {validator.name}: {str(e)}")
             # Return a critical error result
@@ -407,23 +417,7 @@ class ValidationEngine:
     
     def _generate_summary(self, results: List[ValidationResult]) -> ValidationSummary:
         """Generate validation summary from results."""
-        summary = ValidationSummary()
-        summary.total_checks = len(results)
-        
-        for result in results:
-            if result.is_passing:
-                summary.passed_checks += 1
-            elif result.is_failing:
-                summary.failed_checks += 1
-            
-            if result.severity == ValidationSeverity.WARNING:
-                summary.warnings += 1
-            elif result.severity == ValidationSeverity.ERROR:
-                summary.errors += 1
-            elif result.severity == ValidationSeverity.CRITICAL:
-                summary.critical_issues += 1
-        
-        return summary
+        return ValidationSummary.from_results(results)
     
     def _calculate_compliance_score(self, results: List[ValidationResult]) -> float:
         """Calculate compliance score based on validation results."""
@@ -470,13 +464,8 @@ class ValidationEngine:
     
     def _severity_level(self, severity: ValidationSeverity) -> int:
         """Convert severity to numeric level for comparison."""
-        levels = {
-            ValidationSeverity.INFO: 1,
-            ValidationSeverity.WARNING: 2,
-            ValidationSeverity.ERROR: 3,
-            ValidationSeverity.CRITICAL: 4
-        }
-        return levels.get(severity, 0)
+        # Unknown severities rank below INFO, so every threshold filters them out
+        return SEVERITY_RANK.get(severity, -1)
     
     def _result_to_dict(self, result: ValidationResult) -> Dict[str, Any]:
         """Convert ValidationResult to dictionary."""
@@ -484,8 +473,8 @@ class ValidationEngine:
             "id": result.id,
             "rule_id": result.rule_id,
             "rule_name": result.rule_name,
-            "category": result.category.value,
-            "severity": result.severity.value,
+            "category": _CATEGORY_VALUES[result.category],
+            "severity": _SEVERITY_VALUES[result.severity],
             "message": result.message,
             "description": result.description,
             "field_path": result.field_path,
@@ -0,0 +1,86 @@
+"""
+Tests for the ARS compliance validator.
+"""
+import pytest
+
+from app.services.validation import ARSValidator
+from app.services.validation.base_validator import ValidationContext
+
+
+def _summarize(results):
+    """Reduce results to the fields that identify a finding."""
+    return [(r.rule_id, r.severity, r.message, r.field_path, r.value) for r in results]
+
+
+class TestARSValidator:
+    """Test ARS validator batch and streaming entry points."""
+    
+    @pytest.fixture
+    def validator(self) -> ARSValidator:
+        """Get ARS validator instance."""
+        return ARSValidator()
+    
+    @pytest.fixture
+    def items(self) -> list:
+        """Objects of several types paired with their validation contexts."""
+        return [
+            ({"id": "RE001", "name": "Primary Efficacy"}, ValidationContext(object_type="reporting_event")),
+            (
+                {"id": "AN001", "purpose": "UNKNOWN", "reason": "OTHER", "analysisSetId": ""},
+                ValidationContext(object_type="analysis")
+            ),
+            ({"id": "AN_STUDY01_01_DEMOG"}, ValidationContext(object_type="analysis")),
+            ({"id": "MT001"}, ValidationContext(object_type="method")),
+            ({"id": "OUT001", "fileSpecifications": [{}]}, ValidationContext(object_type="output")),
+            (["not", "a", "dict"], ValidationContext(object_type="analysis")),
+        ]
+    
+    def test_validate_many_matches_validate(self, validator: ARSValidator, items: list):
+        """Test that validate_many returns the same findings as validate per item."""
+        batch = list(validator.validate_many(items))
+        
+        assert [context for context, _ in batch] == [context for _, context in items]
+        for (data, context), (_, results) in zip(items, batch):
+            assert _summarize(results) == _summarize(validator.validate(data, context))
+        assert any(results for _, results in batch)
+    
+    def test_iter_validate_respects_disabled_rules(self, validator: ARSValidator):
+        """Test that iter_validate skips rules disabled on the validator."""
+        data = {"id": "AN001", "purpose": "UNKNOWN"}
+        context = ValidationContext(object_type="analysis")
+        
+        assert {r.rule_id for r in validator.iter_validate(data, context)} == {"ars_002", "ars_011"}
+        
+        validator.disable_rule("ars_002")
+        
+        assert {r.rule_id for r in validator.iter_validate(data, context)} == {"ars_011"}
+        assert _summarize(validator.iter_validate(data, context)) == _summarize(validator.validate(data, context))
+        
+        validator.enable_rule("ars_002")
+        
+        assert {r.rule_id for r in validator.iter_validate(data, context)} == {"ars_002", "ars_011"}
+    
+    @pytest.mark.parametrize("data, object_type, expected", [
+        (
+            {"id": "MT_STUDY01_01_DESC", "operations": [{"programmingCode": "proc means; run;"}]},
+            "method",
+            ["operations[0].programmingCode.context", "operations[0].programmingCode.code"]
+        ),
+        (
+            {"id": "OUT_STUDY01_01_DEMO", "fileSpecifications": ["table.rtf"]},
+            "output",
+            ["fileSpecifications[0].name", "fileSpecifications[0].fileType"]
+        ),
+        (
+            {"condition": "AGE>18"},
+            "where_clause",
+            ["condition.dataset", "condition.variable", "condition.comparator"]
+        ),
+    ])
+    def test_non_dict_values_report_missing_fields(
+        self, validator: ARSValidator, data: dict, object_type: str, expected: list
+    ):
+        """Test that non-object nested values produce findings instead of raising."""
+        results = validator.validate(data, ValidationContext(object_type=object_type))
+        
+        assert [r.field_path for r in results] == expected
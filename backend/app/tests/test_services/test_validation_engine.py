@@ -0,0 +1,124 @@
+"""
+Tests for the validation engine and base validator.
+"""
+from dataclasses import asdict
+from typing import Any, Iterator, List
+
+import pytest
+
+from app.services.validation import ValidationEngine
+from app.services.validation.base_validator import (
+    BaseValidator, ValidationCategory, ValidationContext, ValidationResult, ValidationSeverity
+)
+
+
+class StubValidator(BaseValidator):
+    """Validator yielding a fixed sequence of results and counting those produced."""
+    
+    severities = (
+        ValidationSeverity.ERROR,
+        ValidationSeverity.CRITICAL,
+        ValidationSeverity.ERROR,
+        ValidationSeverity.CRITICAL,
+    )
+    
+    def __init__(self):
+        super().__init__("Stub Validator")
+        self.produced = 0
+    
+    def get_supported_rules(self) -> List[str]:
+        return [f"stub_{i:03d}" for i in range(len(self.severities))]
+    
+    def validate(self, data: Any, context: ValidationContext) -> List[ValidationResult]:
+        return list(self.iter_validate(data, context))
+    
+    def iter_validate(self, data: Any, context: ValidationContext) -> Iterator[ValidationResult]:
+        for i, severity in enumerate(self.severities):
+            self.produced += 1
+            yield self.create_result(
+                rule_id=f"stub_{i:03d}",
+                rule_name="Stub rule",
+                category=ValidationCategory.DATA_INTEGRITY,
+                severity=severity,
+                message=f"Stub result {i}"
+            )
+
+
+class TestFailFast:
+    """Test fail-fast validation in validators and the engine."""
+    
+    @pytest.fixture
+    def validator(self) -> StubValidator:
+        """Get stub validator instance."""
+        return StubValidator()
+    
+    def test_run_without_fail_fast_returns_all_results(self, validator: StubValidator):
+        """Test that a normal run collects every result."""
+        results = validator.run({}, ValidationContext(object_type="analysis"))
+        
+        assert [r.rule_id for r in results] == ["stub_000", "stub_001", "stub_002", "stub_003"]
+    
+    def test_run_stops_at_first_critical(self, validator: StubValidator):
+        """Test that a fail-fast run stops at the first CRITICAL result."""
+        context = ValidationContext(object_type="analysis", fail_fast=True)
+        
+        results = validator.run({}, context)
+        
+        assert [r.rule_id for r in results] == ["stub_000", "stub_001"]
+        assert results[-1].severity == ValidationSeverity.CRITICAL
+        assert validator.produced == 2
+    
+    def test_run_stops_at_custom_severity(self, validator: StubValidator):
+        """Test that stop_on lowers the severity that ends a fail-fast run."""
+        context = ValidationContext(
+            object_type="analysis", fail_fast=True, stop_on=ValidationSeverity.ERROR
+        )
+        
+        results = validator.run({}, context)
+        
+        assert [r.rule_id for r in results] == ["stub_000"]
+    
+    def test_fail_fast_profile_stops_validator(self, validator: StubValidator):
+        """Test that a fail-fast profile stops each validator at its first CRITICAL result."""
+        engine = ValidationEngine()
+        engine._validators["stub"] = validator
+        engine.create_custom_profile(
+            "stub_fail_fast", enabled_validators=["stub"], fail_fast=True, parallel_execution=False
+        )
+        context = ValidationContext(object_type="analysis")
+        
+        report = engine.validate({}, context, "stub_fail_fast")
+        
+        assert [r["rule_id"] for r in report["results"]] == ["stub_000", "stub_001"]
+        assert report["summary"]["critical_issues"] == 1
+        assert validator.produced == 2
+        # The caller's context is left unchanged
+        assert context.fail_fast is False
+
+
+class TestValidationResult:
+    """Test the public shape of validation results."""
+    
+    def test_id_is_a_field(self):
+        """Test that id can be passed in and is serialized with the result."""
+        result = ValidationResult(id="RESULT001", rule_id="ars_001")
+        
+        assert result.id == "RESULT001"
+        assert asdict(result)["id"] == "RESULT001"
+    
+    def test_default_ids_are_unique(self):
+        """Test that each result gets its own generated id."""
+        first, second = ValidationResult(), ValidationResult()
+        
+        assert first.id and second.id
+        assert first.id != second.id
+    
+    def test_repeated_runs_return_new_results(self):
+        """Test that validating the same data twice yields results with new ids."""
+        validator = StubValidator()
+        context = ValidationContext(object_type="analysis")
+        
+        first = validator.run({}, context)
+        second = validator.run({}, context)
+        
+        assert {r.id for r in first}.isdisjoint(r.id for r in second)